@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import sys
+from typing import Any, Dict, List, Union
+
+import pytest
+from typing_extensions import TypeAliasType
+
+
+@pytest.fixture()
+def json_alias() -> Any:
+    """A recursive type alias, ``type Json = int | str | list[Json] | dict[str, Json]``."""
+    if sys.version_info >= (3, 12):
+        namespace: dict[str, Any] = {}
+        exec("type Json = int | str | list[Json] | dict[str, Json]", namespace)
+        return namespace["Json"]
+
+    # Before 3.12, the value of a ``typing_extensions.TypeAliasType`` cannot refer to the alias itself.
+    json = TypeAliasType("Json", int)  # type: ignore[misc]  # pyright: ignore[reportGeneralTypeIssues]
+    object.__setattr__(json, "__value__", Union[int, str, List[json], Dict[str, json]])  # type: ignore[valid-type]
+    return json
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import inspect
+import itertools
+from typing import Any
+
+import pytest
+
+from type_lens import CallableView
+
+
+def handler(a: int, b: int = 2, /, c: int = 3, *args: int, d: int, e: int = 5, **kwargs: int) -> None: ...
+
+
+def plain(a: int, b: str, c: bool = True) -> None: ...
+
+
+@pytest.mark.parametrize("fn", [handler, plain])
+@pytest.mark.parametrize(
+    ("args", "kwargs"),
+    [
+        ((1,), {"d": 4}),
+        ((1, 2, 3, 4, 5), {"d": 4, "x": 1}),
+        ((1, "b"), {}),
+        ((1, "b", False), {}),
+        ((1,), {"b": "b"}),
+        ((1,), {"d": 1, "c": 2}),
+        ((1, 2), {"a": 1, "d": 2}),
+        ((), {"a": 1, "d": 2}),
+        ((1,), {}),
+        ((1, 2, 3, 4), {}),
+        ((1, "b"), {"b": "b"}),
+        ((1, "b"), {"x": 1}),
+    ],
+)
+def test_bind_matches_signature(fn: Any, args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+    view = CallableView.from_callable(fn)
+    signature = inspect.signature(fn)
+
+    try:
+        bound = signature.bind(*args, **kwargs)
+    except TypeError as e:
+        with pytest.raises(TypeError, match=str(e)):
+            view.bind(*args, **kwargs)
+        return
+
+    assert view.bind(*args, **kwargs) == bound.arguments
+    assert list(view.bind(*args, **kwargs)) == list(bound.arguments)
+    bound.apply_defaults()
+    assert view.binding_plan.bind(args, kwargs, apply_defaults=True) == bound.arguments
+
+
+def test_binding_plan() -> None:
+    plan = CallableView.from_callable(handler).binding_plan
+
+    assert plan.names == ("a", "b", "c", "d", "e")
+    assert plan.positional == ("a", "b", "c")
+    assert plan.keywords == {"c", "d", "e"}
+    assert plan.positional_only == {"a", "b"}
+    assert plan.var_positional == "args"
+    assert plan.var_keyword == "kwargs"
+    assert repr(plan) == "BindingPlan(a, b, c, args, d, e, kwargs)"
+
+
+def keyword_only(a: int, /, b: int, *, c: int = 1) -> None: ...
+
+
+def positional_only(a: int, b: int = 2, /, **kwargs: int) -> None: ...
+
+
+def variadic(a: int, *args: int, b: int, c: int = 3) -> None: ...
+
+
+def defaults_only(a: int = 1, b: int = 2, /, c: int = 3) -> None: ...
+
+
+@pytest.mark.parametrize("fn", [handler, plain, keyword_only, positional_only, variadic, defaults_only])
+def test_bind_matches_signature_exhaustively(fn: Any) -> None:
+    view = CallableView.from_callable(fn)
+    signature = inspect.signature(fn)
+    names = [*signature.parameters, "x"]
+
+    for count in range(len(names)):
+        args = tuple(range(count))
+        for keys in itertools.chain.from_iterable(itertools.combinations(names, n) for n in range(len(names) + 1)):
+            kwargs = dict.fromkeys(keys, 0)
+            try:
+                bound = signature.bind(*args, **kwargs)
+            except TypeError as e:
+                with pytest.raises(TypeError) as info:
+                    view.bind(*args, **kwargs)
+                assert str(info.value) == str(e), (args, kwargs)
+                continue
+
+            assert view.bind(*args, **kwargs) == bound.arguments, (args, kwargs)
+            bound.apply_defaults()
+            assert view.binding_plan.bind(args, kwargs, apply_defaults=True) == bound.arguments, (args, kwargs)
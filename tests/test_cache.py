@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from type_lens.cache import BoundedCache, CacheInfo
+
+
+def test_bounded_cache_get_and_set() -> None:
+    cache: BoundedCache[str, int] = BoundedCache(maxsize=2)
+
+    assert cache.get("a") is None
+    assert cache.set("a", 1) == 1
+    assert cache.get("a") == 1
+    assert cache.info() == CacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+
+
+def test_bounded_cache_set_keeps_existing_value() -> None:
+    cache: BoundedCache[str, int] = BoundedCache()
+    cache.set("a", 1)
+
+    assert cache.set("a", 2) == 1
+    assert cache.get("a") == 1
+
+
+def test_bounded_cache_evicts_oldest() -> None:
+    cache: BoundedCache[str, int] = BoundedCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_bounded_cache_pop_and_clear() -> None:
+    cache: BoundedCache[str, int] = BoundedCache(maxsize=None)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    assert cache.pop("a") == 1
+    assert cache.pop("a") is None
+
+    cache.get("b")
+    cache.clear()
+    assert cache.info() == CacheInfo(hits=0, misses=0, maxsize=None, currsize=0)
@@ -1,6 +1,11 @@
+# ruff: noqa: UP006
 from __future__ import annotations
 
+import gc
+import inspect
+import pickle
 import sys
+import types
 from dataclasses import dataclass
 from typing import Any, List, Optional, Type, Union, cast
 
@@ -143,3 +148,182 @@ def test_evaluated_runtime_type() -> None:
         assert fn_view1.parameters == (ParameterView("a", TypeView(Union[List[int], None]), default=None),)  # pyright: ignore
     else:
         assert fn_view1.parameters == (ParameterView("a", TypeView(Union[list[int], None]), default=None),)  # pyright: ignore
+
+
+StrOrInt = Union[str, int]
+BytesOrFloat = Union[bytes, float]
+
+
+def test_parameter_views_keep_order_of_union_members() -> None:
+    def fn(foo: StrOrInt) -> BytesOrFloat:
+        return 0.0
+
+    TypeView.of(Union[int, str])
+    TypeView.of(Union[float, bytes])
+    fn_view = CallableView.from_callable(fn)
+
+    assert fn_view.parameters[0].type_view.args == (str, int)
+    assert fn_view.return_type.args == (bytes, float)
+
+
+def test_from_callable_cache() -> None:
+    def fn(foo: int) -> int:
+        return foo
+
+    CallableView.clear_cache()
+    view = CallableView.from_callable(fn, cache=True)
+
+    cached = CallableView.from_callable(fn, cache=True)
+    assert cached == view
+    assert cached.callable is fn
+    assert cached.parameters is view.parameters
+    assert CallableView.from_callable(fn).parameters is not view.parameters
+    assert CallableView.from_callable(fn, include_extras=True, cache=True).parameters is not view.parameters
+    assert CallableView.cache_info() == (1, 2, None, 1)
+
+
+def test_from_callable_cache_invalidation() -> None:
+    def fn(foo: int) -> int:
+        return foo
+
+    CallableView.from_callable(fn, cache=True)
+
+    fn.__annotations__["foo"] = str
+    changed = CallableView.from_callable(fn, cache=True)
+    assert changed.parameters == (ParameterView("foo", TypeView(str)),)
+
+    fn.__signature__ = inspect.Signature()  # type: ignore[attr-defined]
+    assert CallableView.from_callable(fn, cache=True).parameters == ()
+
+
+def test_from_callable_cache_is_weak() -> None:
+    def fn(foo: int) -> int:
+        return foo
+
+    CallableView.clear_cache()
+    CallableView.from_callable(fn, cache=True)
+    assert CallableView.cache_info().currsize == 1
+
+    del fn
+    gc.collect()
+    assert CallableView.cache_info().currsize == 0
+
+
+def test_from_callable_cache_bypassed_for_namespaces() -> None:
+    def fn(foo: Model) -> None:  # type: ignore[name-defined]  # noqa: F821
+        return
+
+    CallableView.clear_cache()
+    int_view = CallableView.from_callable(fn, localns={"Model": int}, cache=True)  # pyright: ignore
+    str_view = CallableView.from_callable(fn, localns={"Model": str}, cache=True)  # pyright: ignore
+
+    assert int_view.parameters[0].type_view.annotation is int
+    assert str_view.parameters[0].type_view.annotation is str
+    assert CallableView.cache_info().currsize == 0
+
+
+_MODULE_SOURCE = """
+from __future__ import annotations
+
+from typing import List, Optional
+
+
+class Model:
+    def method(self, other: Model) -> List[Model]: ...
+
+    @classmethod
+    def create(cls, value: int = 0) -> Model: ...
+
+
+def first(models: List[Model], limit: Optional[int] = None) -> Model: ...
+
+
+def second(models: List[Model]) -> None: ...
+"""
+
+
+def _make_module() -> types.ModuleType:
+    module = types.ModuleType("tests.generated_handlers")
+    exec(_MODULE_SOURCE, module.__dict__)
+    return module
+
+
+def test_from_many_matches_from_callable() -> None:
+    module = _make_module()
+    fns = [module.first, module.second, module.Model.method, len]
+
+    views = CallableView.from_many(fns, include_extras=True)
+
+    assert list(views) == fns
+    for fn in fns:
+        assert views[fn] == CallableView.from_callable(fn, include_extras=True)
+
+
+def test_from_many_unresolvable_annotation() -> None:
+    def fn(foo: Undefined) -> None:  # type: ignore[name-defined]  # noqa: F821  # pyright: ignore
+        return None
+
+    def other(foo: int) -> None:
+        return None
+
+    with pytest.raises(NameError):
+        CallableView.from_many([other, fn])  # pyright: ignore[reportUnknownArgumentType]
+
+
+def test_from_module() -> None:
+    module = _make_module()
+
+    views = CallableView.from_module(module)
+
+    model = module.Model
+    assert set(views) == {module.first, module.second, model.method, model.__dict__["create"].__func__}
+    assert views[module.first].parameters == (
+        ParameterView("models", TypeView(List[model])),  # type: ignore[valid-type]
+        ParameterView("limit", TypeView(Optional[int]), default=None),
+    )
+    assert views[model.method].return_type == TypeView(List[model])  # type: ignore[valid-type]
+
+
+def test_parameter_indexes() -> None:
+    def fn(  # type: ignore[no-untyped-def]
+        a: int,
+        b: Optional[str],
+        c: Annotated[int, "meta"] = 1,
+        *args: Any,
+        d: None = None,
+        e,  # pyright: ignore
+        **kwargs: int,
+    ) -> None: ...
+
+    view = CallableView.from_callable(fn, include_extras=True)  # pyright: ignore[reportUnknownArgumentType]
+
+    assert view.parameter_map["c"] is view.parameters[2]
+    assert list(view.parameter_map) == ["a", "b", "c", "args", "d", "e", "kwargs"]
+    assert view.required_names == {"a", "b", "e"}
+    assert dict(view.defaults) == {"c": 1, "d": None}
+    assert view.nullable_names == {"b", "d", "e"}
+    assert list(view.annotated_parameters) == ["c"]
+    assert view.annotated_parameters["c"].type_view.metadata == ("meta",)
+
+
+def test_nullable_names_exclude_variadic_parameters() -> None:
+    def fn(a: Optional[int], *args: Optional[int], b: Any, **kwargs: None) -> None: ...
+
+    assert CallableView.from_callable(fn).nullable_names == {"a", "b"}
+
+
+def _pickled(a: int, b: Optional[List[str]] = None, *, c: Annotated[int, "meta"] = 1) -> Optional[int]: ...
+
+
+def test_pickle() -> None:
+    view = CallableView.from_callable(_pickled, include_extras=True)
+    view.bind(1)
+
+    unpickled = pickle.loads(pickle.dumps(view))
+
+    assert unpickled == view
+    assert unpickled.signature == view.signature
+    assert unpickled.return_type is view.return_type
+    assert all(a.type_view is b.type_view for a, b in zip(unpickled.parameters, view.parameters))
+    assert unpickled.required_names == {"a"}
+    assert unpickled.bind(1, c=2) == {"a": 1, "c": 2}
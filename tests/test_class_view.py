@@ -0,0 +1,160 @@
+# ruff: noqa: UP006
+from __future__ import annotations
+
+import pickle
+from collections import namedtuple
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, List, NamedTuple, Optional
+
+import pytest
+from typing_extensions import Annotated, NotRequired, Required, TypedDict
+
+from type_lens import ClassView, FieldView, TypeView
+from type_lens.types.empty import Empty
+
+
+class Movie(TypedDict, total=False):
+    title: Required[str]
+    year: int
+
+
+class Sequel(Movie):
+    prequel: Movie
+    rating: NotRequired[Annotated[float, "stars"]]
+
+
+@dataclass
+class Item:
+    name: str
+    tags: List[str] = field(default_factory=list)  # pyright: ignore[reportUnknownVariableType]
+    price: Optional[float] = None
+    count: ClassVar[int] = 0
+    cached: int = field(default=0, init=False)
+
+
+class Point(NamedTuple):
+    x: int
+    y: int = 0
+
+
+def test_typeddict() -> None:
+    view = ClassView.from_class(Sequel)
+
+    assert view.kind == "typeddict"
+    assert [f.name for f in view.fields] == ["title", "year", "prequel", "rating"]
+    assert view.required_keys == {"title", "prequel"}
+    assert view.optional_keys == {"year", "rating"}
+    assert view.field_map["title"].type_view.annotation is str
+    assert view.field_map["rating"].type_view.metadata == ("stars",)
+    assert view.field_map["prequel"].type_view == TypeView(Movie)
+
+
+def test_dataclass() -> None:
+    view = ClassView.from_class(Item)
+
+    assert view.kind == "dataclass"
+    assert view.fields == (
+        FieldView("name", TypeView(str)),
+        FieldView("tags", TypeView(List[str]), default_factory=list),
+        FieldView("price", TypeView(Optional[float]), default=None),
+    )
+    assert view.required_keys == {"name"}
+    assert view.optional_keys == {"tags", "price"}
+
+
+def test_namedtuple() -> None:
+    view = ClassView.from_class(Point)
+
+    assert view.kind == "namedtuple"
+    assert view.fields == (FieldView("x", TypeView(int)), FieldView("y", TypeView(int), default=0))
+    assert view.required_keys == {"x"}
+
+
+def test_untyped_namedtuple() -> None:
+    view = ClassView.from_class(namedtuple("Pair", ["a", "b"], defaults=[1]))  # pyright: ignore[reportUntypedNamedTuple]
+
+    assert view.fields == (
+        FieldView("a", TypeView(Any), has_annotation=False),
+        FieldView("b", TypeView(Any), default=1, has_annotation=False),
+    )
+
+
+def test_attrs() -> None:
+    attr = pytest.importorskip("attr")
+
+    @attr.s(auto_attribs=True)
+    class Model:
+        a: int
+        b: List[int] = attr.ib(factory=list)
+        c: str = "c"
+        d: int = attr.ib(default=attr.Factory(lambda self: self.a, takes_self=True))  # pyright: ignore
+        e: int = attr.ib(default=0, init=False)
+
+    view = ClassView.from_class(Model)
+
+    assert view.kind == "attrs"
+    assert view.fields == (
+        FieldView("a", TypeView(int)),
+        FieldView("b", TypeView(List[int]), default_factory=list),
+        FieldView("c", TypeView(str), default="c"),
+        FieldView("d", TypeView(int), is_required=False),
+    )
+    assert view.required_keys == {"a"}
+
+
+@pytest.mark.parametrize("model", [int, dict, object()])
+def test_unsupported(model: Any) -> None:
+    with pytest.raises(ValueError):
+        ClassView.from_class(model)
+
+
+def test_forward_references() -> None:
+    @dataclass
+    class Node:
+        children: List[Node]
+
+    view = ClassView.from_class(Node, localns={"Node": Node})
+
+    assert view.field_map["children"].type_view == TypeView(List[Node])
+    assert view.field_map["children"].default is Empty
+
+
+def test_from_class_cache() -> None:
+    ClassView.clear_cache()
+
+    view = ClassView.from_class(Item, cache=True)
+    assert ClassView.from_class(Item, cache=True) is view
+    assert ClassView.from_class(Item) is not view
+    assert ClassView.cache_info().hits == 1
+
+
+def test_from_class_cache_namespaces() -> None:
+    @dataclass
+    class Model:
+        value: Value  # type: ignore[name-defined]  # noqa: F821
+
+    ClassView.clear_cache()
+
+    int_view = ClassView.from_class(Model, localns={"Value": int}, cache=True)
+    assert int_view.fields[0].type_view.annotation is int
+    # The first namespace is no longer referenced, so the second may well reuse its id.
+    str_view = ClassView.from_class(Model, localns={"Value": str}, cache=True)
+    assert str_view.fields[0].type_view.annotation is str
+
+
+def test_typeddict_total() -> None:
+    class Total(TypedDict):
+        a: int
+        b: NotRequired[int]
+
+    assert ClassView.from_class(Total).required_keys == {"a"}
+
+
+@pytest.mark.parametrize("model", [Sequel, Item, Point])
+def test_pickle(model: type) -> None:
+    view = ClassView.from_class(model)
+
+    unpickled = pickle.loads(pickle.dumps(view))
+
+    assert unpickled == view
+    assert unpickled.required_keys == view.required_keys
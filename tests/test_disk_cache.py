@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import importlib
+import sys
+import types
+from pathlib import Path
+from typing import Any, Iterator, List, Optional
+
+import pytest
+
+from type_lens import CallableView
+from type_lens.disk_cache import DiskCache
+
+SOURCE = """
+from __future__ import annotations
+
+from typing import List, Optional
+
+from typing_extensions import Annotated
+
+
+class Model: ...
+
+
+class Handlers:
+    def handle(self, models: List[Model], limit: Annotated[Optional[int], "meta"] = None) -> Model: ...
+
+
+def handler(model: Model) -> Optional[Model]: ...
+"""
+
+
+@pytest.fixture()
+def module(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[types.ModuleType]:
+    source = tmp_path / "src" / "disk_cache_handlers.py"
+    source.parent.mkdir()
+    source.write_text(SOURCE)
+    monkeypatch.syspath_prepend(str(source.parent))  # pyright: ignore[reportUnknownMemberType]
+    yield importlib.import_module("disk_cache_handlers")
+    sys.modules.pop("disk_cache_handlers", None)
+
+
+def _introspection_fails(*args: Any, **kwargs: Any) -> Any:
+    raise AssertionError("introspected again")
+
+
+def test_from_callable_rehydrates_views(tmp_path: Path, module: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+    fns = [module.Handlers.handle, module.handler]
+    expected = CallableView.from_many(fns, include_extras=True)
+
+    assert DiskCache(tmp_path / "cache").from_many(fns, include_extras=True) == expected
+    assert (tmp_path / "cache" / "disk_cache_handlers.pickle").is_file()
+
+    monkeypatch.setattr(CallableView, "from_many", _introspection_fails)
+    cache = DiskCache(tmp_path / "cache")
+    view = cache.from_callable(module.Handlers.handle, include_extras=True)
+
+    assert view == expected[module.Handlers.handle]
+    assert view.callable is module.Handlers.handle
+    assert view.parameters[2].type_view.metadata == ("meta",)
+    assert view.return_type.annotation is module.Model
+    assert cache.from_many(fns, include_extras=True) == expected
+
+
+def test_include_extras_is_part_of_the_key(tmp_path: Path, module: Any) -> None:
+    cache = DiskCache(tmp_path)
+
+    with_extras = cache.from_callable(module.Handlers.handle, include_extras=True)
+    without_extras = DiskCache(tmp_path).from_callable(module.Handlers.handle)
+
+    assert with_extras.parameters[2].type_view.metadata == ("meta",)
+    assert without_extras.parameters[2].type_view.metadata == ()
+
+
+def test_source_change_invalidates_entries(tmp_path: Path, module: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+    DiskCache(tmp_path / "cache").from_callable(module.handler)
+
+    Path(module.__file__).write_text(SOURCE.replace("-> Optional[Model]", "-> List[Model]"))
+    module = importlib.reload(module)
+    view = DiskCache(tmp_path / "cache").from_callable(module.handler)
+
+    assert view.return_type.annotation == List[module.Model]
+    monkeypatch.setattr(CallableView, "from_many", _introspection_fails)
+    assert DiskCache(tmp_path / "cache").from_callable(module.handler) == view
+
+
+def test_bound_methods_are_keyed_apart_from_functions(tmp_path: Path, module: Any) -> None:
+    DiskCache(tmp_path).from_callable(module.Handlers.handle)
+
+    cache = DiskCache(tmp_path)
+    bound = cache.from_callable(module.Handlers().handle)
+    function = cache.from_callable(module.Handlers.handle)
+
+    assert [p.name for p in bound.parameters] == ["models", "limit"]
+    assert [p.name for p in function.parameters] == ["self", "models", "limit"]
+    assert DiskCache(tmp_path).from_callable(module.Handlers().handle).parameters == bound.parameters
+
+
+def test_corrupt_file_is_ignored(tmp_path: Path, module: Any) -> None:
+    (tmp_path / "disk_cache_handlers.pickle").write_bytes(b"not a pickle")
+
+    view = DiskCache(tmp_path).from_callable(module.handler)
+
+    assert view == CallableView.from_callable(module.handler)
+
+
+def test_unlocatable_callables_are_not_stored(tmp_path: Path) -> None:
+    def local(value: Optional[int]) -> int:
+        return value or 0
+
+    cache = DiskCache(tmp_path)
+
+    assert cache.from_callable(local) == CallableView.from_callable(local)
+    assert cache.from_callable(lambda value: value).parameters[0].name == "value"  # pyright: ignore
+    assert not list(tmp_path.iterdir())
+
+
+def test_clear(tmp_path: Path, module: Any) -> None:
+    cache = DiskCache(tmp_path)
+    cache.from_callable(module.handler)
+
+    cache.clear()
+
+    assert not list(tmp_path.glob("*.pickle"))
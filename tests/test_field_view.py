@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from typing import Any
+
+from type_lens.field_view import FieldView
+from type_lens.type_view import TypeView
+from type_lens.types.empty import Empty
+
+
+def test_field_view_from_annotation() -> None:
+    field = FieldView.from_annotation("foo", {"foo": int}, default=1)
+
+    assert field.name == "foo"
+    assert field.type_view == TypeView(int)
+    assert field.default == 1
+    assert field.default_factory is Empty
+    assert field.has_default
+    assert not field.is_required
+    assert repr(field) == "FieldView('foo', TypeView(int), default=1)"
+
+
+def test_field_view_missing_annotation() -> None:
+    field = FieldView.from_annotation("foo", {})
+
+    assert field.type_view == TypeView(Any)
+    assert not field.has_annotation
+    assert field.is_required
+
+
+def test_field_view_is_required() -> None:
+    assert FieldView("foo", default_factory=list).is_required is False
+    assert FieldView("foo", is_required=False).is_required is False
+    field = FieldView("foo", TypeView(int), is_required=False)
+    assert repr(field) == "FieldView('foo', TypeView(int), is_required=False)"
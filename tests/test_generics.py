@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from typing import Dict, Generic, List, Protocol, TypeVar
+
+from type_lens import TypeView
+from type_lens.generics import clear_generic_bases_cache, generic_bases_cache_info, get_generic_bases
+
+T = TypeVar("T")
+K = TypeVar("K")
+V = TypeVar("V")
+T_co = TypeVar("T_co", covariant=True)
+
+
+class Repo(Generic[T]): ...
+
+
+class Mid(Repo[List[K]], Generic[K, V]): ...
+
+
+class Leaf(Mid[int, str]): ...
+
+
+class StrDict(Dict[str, T]): ...
+
+
+class IntDict(StrDict[int]): ...
+
+
+class Proto(Protocol[T_co]):
+    def get(self) -> T_co: ...
+
+
+class Impl(Proto[bytes]): ...
+
+
+def test_get_generic_bases() -> None:
+    assert dict(get_generic_bases(Repo)) == {Repo: TypeView(Repo[T]), object: TypeView(object)}  # type: ignore[valid-type]  # pyright: ignore[reportGeneralTypeIssues]
+    assert dict(get_generic_bases(Leaf)) == {
+        Leaf: TypeView(Leaf),
+        Mid: TypeView(Mid[int, str]),
+        Repo: TypeView(Repo[List[int]]),
+        object: TypeView(object),
+    }
+    assert list(get_generic_bases(IntDict)) == [IntDict, StrDict, dict, object]
+    assert get_generic_bases(IntDict)[dict] == TypeView(Dict[str, int])
+    assert get_generic_bases(Impl)[Proto] == TypeView(Proto[bytes])
+
+
+def test_get_generic_bases_is_cached() -> None:
+    clear_generic_bases_cache()
+
+    bases = get_generic_bases(Leaf)
+    assert get_generic_bases(Leaf) is bases
+    assert generic_bases_cache_info().hits >= 1
+
+    clear_generic_bases_cache()
+    assert get_generic_bases(Leaf) is not bases
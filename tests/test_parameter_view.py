@@ -23,6 +23,15 @@ def test_from_parameter_coerces_empty_annotation() -> None:
     assert ParameterView.from_parameter(param, {}).type_view == TypeView(Any)
 
 
+def test_param_view_kind() -> None:
+    param = Parameter("foo", Parameter.KEYWORD_ONLY, annotation=int)
+    param_view = ParameterView.from_parameter(param, {"foo": int})
+
+    assert param_view.kind is Parameter.KEYWORD_ONLY
+    assert param_view != ParameterView("foo", TypeView(int))
+    assert repr(param_view) == "ParameterView('foo', TypeView(int), kind=KEYWORD_ONLY)"
+
+
 def test_param_view_has_default_predicate() -> None:
     """Test ParameterView.has_default."""
     param = Parameter("foo", Parameter.POSITIONAL_OR_KEYWORD, annotation=int)
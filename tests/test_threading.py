@@ -0,0 +1,181 @@
+# ruff: noqa: UP006
+"""Stress tests of concurrent use of the shared caches, with or without the GIL."""
+
+from __future__ import annotations
+
+import sys
+import threading
+from typing import Any, Callable, Dict, Generic, Iterator, List, Optional, Tuple, TypeVar, Union
+
+import pytest
+from typing_extensions import Annotated, Literal
+
+from type_lens import CallableView, TypeView
+from type_lens.generics import clear_generic_bases_cache, get_generic_bases
+
+THREADS = 16
+ROUNDS = 20
+
+T = TypeVar("T")
+S = TypeVar("S")
+
+ANNOTATIONS = [
+    int,
+    Optional[str],
+    List[Dict[str, Tuple[int, ...]]],
+    Union[int, str, None, List[Optional[float]]],
+    Annotated[Optional[List[Annotated[int, "item"]]], "meta"],
+    Literal["a", "b", 1],
+    Callable[[int], str],
+]
+
+
+class Repo(Generic[T]): ...
+
+
+class UserRepo(Repo[int]): ...
+
+
+def handler(a: int, b: Optional[List[str]] = None, *, c: Annotated[Dict[str, int], "meta"]) -> Optional[int]: ...
+
+
+def other_handler(items: List[Tuple[int, str]], flag: bool = False) -> None: ...
+
+
+@pytest.fixture(autouse=True)
+def frequent_switches() -> Iterator[None]:
+    """Switch threads as often as possible, to interleave them within the library's code."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def _run_concurrently(fn: Callable[[], Any]) -> list[Any]:
+    """Call ``fn`` from many threads started at once, and return the results of each thread."""
+    barrier = threading.Barrier(THREADS)
+    results: list[Any] = [None] * THREADS
+    errors: list[BaseException] = []
+
+    def run(index: int) -> None:
+        barrier.wait()
+        try:
+            results[index] = fn()
+        except BaseException as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+    return results
+
+
+def _walk(view: TypeView[Any]) -> list[TypeView[Any]]:
+    views = [view]
+    for inner in view.inner_types:
+        views.extend(_walk(inner))
+    return views
+
+
+def test_interned_views_are_shared() -> None:
+    for _ in range(ROUNDS):
+        TypeView.clear_cache()
+        results = _run_concurrently(lambda: [TypeView.of(annotation) for annotation in ANNOTATIONS])
+
+        for views in results:
+            assert all(a is b for a, b in zip(views, results[0]))
+        assert results[0] == [TypeView(annotation) for annotation in ANNOTATIONS]
+
+
+def test_memoized_results_are_consistent() -> None:
+    for _ in range(ROUNDS):
+        views = [TypeView(annotation) for annotation in ANNOTATIONS]
+
+        def use() -> list[Any]:
+            return [
+                (
+                    _walk(view),
+                    view.strip_optional(),
+                    view.compile_validator()(None),
+                    view.compile_validator()([1]),
+                    view.literal_values,
+                    view.union_dispatcher().match("a") if view.is_union else None,
+                )
+                for view in views
+            ]
+
+        results = _run_concurrently(use)
+        for result in results:
+            assert result == results[0]
+
+
+def _holds_args(view: TypeView[Any]) -> bool:
+    """Whether the inner types of every view of the tree are the views of its args, by position."""
+    return all(
+        len(node.inner_types) == len(node.args)
+        and all(inner.raw == arg for inner, arg in zip(node.inner_types, node.args))
+        for node in _walk(view)
+    )
+
+
+def test_substitute_does_not_alter_interned_views() -> None:
+    templates = [Dict[str, List[T]], Union[T, S, int], Optional[Tuple[T, S]]]  # type: ignore[valid-type]  # pyright: ignore[reportGeneralTypeIssues]
+    mapping = {T: int, S: Union[str, bytes]}
+    specialized = [Dict[str, List[int]], Union[int, str, bytes], Optional[Tuple[int, Union[str, bytes]]]]
+
+    for _ in range(ROUNDS):
+        TypeView.clear_cache()
+
+        def use() -> list[TypeView[Any]]:
+            views = [TypeView(template).substitute(mapping) for template in templates]
+            views += [TypeView.of(annotation) for annotation in specialized]
+            return views
+
+        for views in _run_concurrently(use):
+            assert all(_holds_args(view) for view in views)
+        assert all(_holds_args(TypeView.of(annotation)) for annotation in specialized)
+
+
+def test_deep_alias_expansion_is_shared(json_alias: Any) -> None:
+    for _ in range(ROUNDS):
+        TypeView.clear_cache()
+        results = _run_concurrently(lambda: TypeView(json_alias).strip_type_alias(deep=True))
+
+        node = results[0]
+        assert all(result is node for result in results)
+        # The graph is complete: references to the alias close the cycle.
+        assert node.inner_types[2].inner_types[0] is node
+        assert node.inner_types[3].inner_types[1] is node
+
+
+def test_from_callable() -> None:
+    expected = {fn: CallableView.from_callable(fn, include_extras=True) for fn in (handler, other_handler)}
+
+    for _ in range(ROUNDS):
+        CallableView.clear_cache()
+        TypeView.clear_cache()
+
+        def introspect() -> list[CallableView]:
+            return [
+                CallableView.from_callable(fn, include_extras=True, cache=cache)
+                for fn in (handler, other_handler)
+                for cache in (True, False)
+            ]
+
+        for views in _run_concurrently(introspect):
+            assert views == [expected[fn] for fn in (handler, other_handler) for _ in range(2)]
+            assert views[0].required_names == {"a", "c"}
+            assert views[0].bind(1, c={}) == {"a": 1, "c": {}}
+
+
+def test_get_generic_bases() -> None:
+    for _ in range(ROUNDS):
+        clear_generic_bases_cache()
+        results = _run_concurrently(lambda: get_generic_bases(UserRepo))
+
+        assert all(result is results[0] for result in results)
+        assert results[0][Repo] == TypeView(Repo[int])
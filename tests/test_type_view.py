@@ -1,14 +1,18 @@
 # ruff: noqa: UP006
 from __future__ import annotations
 
+import copy
+import pickle
 import sys
 from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
     ForwardRef,
+    Generic,
     List,
     Literal,
+    Mapping,
     Optional,
     Sequence,
     Tuple,
@@ -18,10 +22,10 @@ from typing import (
 )
 
 import pytest
-from typing_extensions import Annotated, NotRequired, Required, get_type_hints
+from typing_extensions import Annotated, NotRequired, Required, TypeAliasType, get_type_hints
 from typing_extensions import Literal as ExtensionsLiteral
 
-from type_lens import TypeView
+from type_lens import TypeView, TypeViewFlag
 from type_lens.types.builtins import NoneType
 
 if TYPE_CHECKING:
@@ -29,6 +33,8 @@ if TYPE_CHECKING:
 
 
 T = TypeVar("T")
+S = TypeVar("S")
+IntAlias = TypeAliasType("IntAlias", int)
 
 
 def _check_parsed_type(type_lens: TypeView[Any], expected: dict[str, Any]) -> None:
@@ -345,6 +351,12 @@ def test_strip_optional() -> None:
     assert TypeView(Optional[int]).strip_optional() == TypeView(int)
     assert TypeView(Optional[Union[str, int]]).strip_optional() == TypeView(Union[str, int])
     assert TypeView(Union[str, int, None]).strip_optional() == TypeView(Union[str, int])
+    assert TypeView(Union[None, int]).strip_optional() == TypeView(int)
+
+    view = TypeView(Union[str, int, None])
+    assert view.strip_optional() is view.strip_optional()
+    assert view.strip_optional().inner_types == view.inner_types[:2]
+    assert view.strip_optional().inner_types[0] is view.inner_types[0]
 
     # Retain metadata
     assert (
@@ -377,6 +389,37 @@ def test_literal() -> None:
     assert TypeView(4).is_literal is False
 
 
+@pytest.mark.parametrize(
+    ("annotation", "expected"),
+    [  # pyright: ignore[reportUnknownArgumentType]
+        (int, set()),
+        (Literal[1, "a"], {1, "a"}),
+        (ExtensionsLiteral[ExtensionsLiteral[1], 2], {1, 2}),  # noqa: RUF041
+        (Union[Literal["a"], Literal["b", "c"]], {"a", "b", "c"}),
+        (Optional[Literal["a"]], {"a", None}),
+        (Union[Literal["a"], int], set()),
+        (Annotated[Literal["a"], "meta"], {"a"}),
+    ],
+)
+def test_literal_values(annotation: Any, expected: set[Any]) -> None:
+    assert TypeView(annotation).literal_values == expected
+
+
+def test_has_literal_value() -> None:
+    view = TypeView(Optional[Literal[1, "a"]])
+
+    assert view.has_literal_value(1) is True
+    assert view.has_literal_value(None) is True
+    assert view.has_literal_value(True) is False
+    assert view.has_literal_value(1.0) is False
+    assert view.has_literal_value([1]) is False
+
+    unhashable = TypeView(Literal[[1], 2])
+    assert unhashable.literal_values == {2}
+    assert unhashable.has_literal_value([1]) is True
+    assert unhashable.has_literal_value((1,)) is False
+
+
 def test_allows_none() -> None:
     assert TypeView(int).allows_none is False
     assert TypeView(Optional[int]).allows_none is True
@@ -473,3 +516,358 @@ def test_strip_type_alias_extensions() -> None:
 
     # Retain metadata
     assert TypeView(Annotated[Foo, 4]).strip_type_alias().metadata == TypeView(int, metadata=[4]).metadata == (4,)
+
+
+def test_of_interns_equal_annotations() -> None:
+    view = TypeView.of(Optional[List[Dict[str, int]]])
+
+    assert TypeView.of(Optional[List[Dict[str, int]]]) is view
+    assert view == TypeView(Optional[List[Dict[str, int]]])
+    assert view.inner_types[0] is TypeView.of(List[Dict[str, int]])
+
+
+def test_of_keys_on_metadata() -> None:
+    assert TypeView.of(int, metadata=[4]) is TypeView.of(int, metadata=(4,))
+    assert TypeView.of(int, metadata=(4,)) is not TypeView.of(int)
+    assert TypeView.of(int, metadata=(4,)).metadata == (4,)
+
+
+def test_of_unhashable_metadata() -> None:
+    view = TypeView.of(Annotated[int, {"unhashable": True}])
+
+    assert view.metadata == ({"unhashable": True},)
+    assert TypeView.of(Annotated[int, {"unhashable": True}]) is not view
+
+
+def test_clear_cache() -> None:
+    view = TypeView.of(int)
+    TypeView.clear_cache()
+
+    assert TypeView.of(int) is not view
+    assert TypeView.of(int) == view
+
+
+def test_of_distinguishes_equal_values_of_different_types() -> None:
+    assert TypeView.of(True).annotation is True
+    assert TypeView.of(1).annotation == 1
+    assert TypeView.of(1).annotation is not True
+    assert TypeView.of(int, metadata=(True,)).metadata[0] is True
+    assert TypeView.of(int, metadata=(1,)).metadata[0] is not True
+
+
+def test_of_distinguishes_order_of_union_members() -> None:
+    view = TypeView.of(Union[int, str])
+
+    assert TypeView.of(Union[str, int]) is not view
+    assert TypeView.of(Union[str, int]).args == (str, int)
+
+
+def test_of_distinguishes_metadata_of_different_types() -> None:
+    assert TypeView.of(Annotated[int, 1]).metadata == (1,)
+    assert TypeView.of(Annotated[int, True]).metadata[0] is True
+    # ``typing`` caches ``List[Annotated[int, True]]`` as the equal ``List[Annotated[int, 1]]``.
+    assert TypeView.of(List[Annotated[int, 1]]).inner_types[0].metadata == (1,)
+    nested = List[int].copy_with((Annotated[int, True],))  # type: ignore[attr-defined]
+    assert TypeView.of(nested).inner_types[0].metadata[0] is True  # pyright: ignore[reportUnknownArgumentType]
+
+
+def test_of_reuses_view_of_same_annotation_object() -> None:
+    annotation = Optional[List[Dict[str, int]]]
+    view = TypeView.of(annotation)
+
+    assert TypeView.of(annotation) is view
+    assert TypeView.of(Optional[List[Dict[str, int]]]) is view
+    assert TypeView.of(annotation, metadata=(1,)) is not view
+
+
+def test_inner_types_are_built_lazily() -> None:
+    view = TypeView(Dict[str, List[Tuple[int, ...]]])
+    assert not hasattr(view, "_inner_types")
+
+    inner_types = view.inner_types
+    assert inner_types == (TypeView(str), TypeView(List[Tuple[int, ...]]))
+    assert view.inner_types is inner_types
+
+
+def test_union_flags_do_not_build_inner_types() -> None:
+    view = TypeView(Optional[Dict[str, int]])
+
+    assert view.is_optional and view.is_union
+    assert not view.is_collection and not view.is_mapping
+    assert TypeView(Union[Dict[str, int], Mapping[str, int]]).is_mapping
+    assert TypeView(Union[str, List[int]]).is_non_string_collection
+    assert not TypeView(Union[str, bytes]).is_non_string_collection
+    assert not hasattr(view, "_inner_types")
+
+
+@pytest.mark.parametrize(
+    ("left", "right"),
+    [
+        (int, int),
+        (int, Annotated[int, "meta"]),
+        (List[int], List[int]),
+        (Optional[str], Union[str, None]),
+        (List[Annotated[int, "meta"]], List[int]),
+        pytest.param(
+            "int | None", Optional[int], marks=pytest.mark.skipif(sys.version_info < (3, 10), reason="Requires 3.10")
+        ),
+    ],
+)
+def test_hash_is_consistent_with_equality(left: Any, right: Any) -> None:
+    if isinstance(left, str):
+        left = eval(left)
+
+    assert TypeView(left) == TypeView(right)
+    assert hash(TypeView(left)) == hash(TypeView(right))
+
+
+def test_hashable() -> None:
+    views = {TypeView(int), TypeView(Annotated[int, "meta"]), TypeView(List[int])}
+
+    assert views == {TypeView(int), TypeView(List[int])}
+    assert {TypeView(Optional[int]): 1}[TypeView(Union[int, None])] == 1
+    assert hash(TypeView(Annotated[int, {"unhashable": True}])) == hash(TypeView(int))
+
+
+def test_flags() -> None:
+    assert TypeView(int).flags == 0
+    assert TypeView(Optional[int]).flags == TypeViewFlag.UNION | TypeViewFlag.OPTIONAL
+    assert TypeView(Annotated[Dict[str, int], "meta"]).flags == (
+        TypeViewFlag.ANNOTATED | TypeViewFlag.COLLECTION | TypeViewFlag.NON_STRING_COLLECTION | TypeViewFlag.MAPPING
+    )
+    assert TypeView(Tuple[int, ...]).flags == (
+        TypeViewFlag.TUPLE | TypeViewFlag.VARIADIC_TUPLE | TypeViewFlag.COLLECTION | TypeViewFlag.NON_STRING_COLLECTION
+    )
+    assert TypeView(str).flags == TypeViewFlag.COLLECTION
+
+
+def test_union_collection_flags() -> None:
+    assert TypeView(Union[str, List[int]]).is_non_string_collection is True
+    assert TypeView(Union[str, bytes]).is_collection is True
+    assert TypeView(Union[str, bytes]).is_non_string_collection is False
+    assert TypeView(Union[Dict[str, int], List[int]]).is_mapping is False
+    assert TypeView(Optional[List[int]]).is_collection is False
+
+
+def test_flags_bulk_filtering() -> None:
+    views: List[TypeView[Any]] = [TypeView(int), TypeView(List[int]), TypeView(Dict[str, int]), TypeView(Optional[str])]
+
+    assert [v for v in views if v.flags & TypeViewFlag.MAPPING] == [TypeView(Dict[str, int])]
+    assert [v for v in views if v.flags & (TypeViewFlag.UNION | TypeViewFlag.MAPPING)] == views[2:]
+
+
+def test_subtype_checks_are_memoized() -> None:
+    from collections.abc import Sized
+
+    class Foo:
+        pass
+
+    view = TypeView(Union[Foo, List[int]])
+    assert view.is_subtype_of(Sized) is False
+    assert TypeView(Foo).is_subclass_of(Sized) is False
+
+    Sized.register(Foo)
+    assert view.is_subtype_of(Sized) is False
+    assert TypeView(Foo).is_subclass_of(Sized) is False
+
+    TypeView.clear_cache()
+    assert view.is_subtype_of(Sized) is True
+    assert TypeView(Foo).is_subclass_of(Sized) is True
+
+
+def test_is_subtype_of_any_str() -> None:
+    from typing import AnyStr
+
+    assert TypeView(AnyStr).is_subtype_of((str, bytes)) is True
+    assert TypeView(AnyStr).is_subtype_of(str) is False
+
+
+def test_resolve_forward_ref() -> None:
+    class Node:
+        children: List[Node]
+        parent: Optional[Node]
+
+    view = TypeView("List[Node]", localns={"Node": Node, "List": List})
+    assert view.is_forward_ref is True
+
+    resolved = view.resolve()
+    assert resolved == TypeView(List[Node])
+    assert view.resolve() is resolved
+    assert resolved.resolve() is resolved
+    assert TypeView(int).resolve() == TypeView(int)
+
+
+def test_resolve_inner_forward_ref() -> None:
+    class Parent:
+        children: List[Child]
+
+    class Child:
+        parent: Parent
+
+    localns = {"Parent": Parent, "Child": Child}
+    view = TypeView(Dict[str, "Child"], localns=localns)
+    child = view.inner_types[1]
+    assert child.is_forward_ref is True
+    assert child.resolve() == TypeView(Child)
+
+    parent = TypeView(Child.__annotations__["parent"], localns=localns).resolve()
+    assert parent == TypeView(Parent)
+
+
+def test_resolve_forward_ref_retains_wrappers_and_metadata() -> None:
+    view = TypeView(Annotated[Required["int"], "meta"], globalns={}).resolve()
+
+    assert view.annotation is int
+    assert view.metadata == ("meta",)
+    assert view.is_required is True
+
+
+def test_resolve_forward_ref_errors() -> None:
+    from type_lens.exc import TypeViewError
+
+    with pytest.raises(TypeViewError, match="without a namespace"):
+        TypeView("int").resolve()
+
+    with pytest.raises(TypeViewError, match="Unable to resolve"):
+        TypeView(ForwardRef("Undefined"), globalns={}).resolve()
+
+
+@pytest.mark.parametrize(
+    ("annotation", "expected"),
+    [
+        (T, int),
+        (List[T], List[int]),  # type: ignore[valid-type]  # pyright: ignore[reportGeneralTypeIssues]
+        (Dict[str, List[T]], Dict[str, List[int]]),  # type: ignore[valid-type]  # pyright: ignore[reportGeneralTypeIssues]
+        (Optional[T], Optional[int]),  # pyright: ignore[reportGeneralTypeIssues]
+        (Union[T, int], int),  # pyright: ignore[reportGeneralTypeIssues]
+        (Tuple[T, ...], Tuple[int, ...]),  # pyright: ignore[reportGeneralTypeIssues]
+        (Annotated[List[T], "meta"], Annotated[List[int], "meta"]),  # type: ignore[valid-type]  # pyright: ignore[reportGeneralTypeIssues]
+        (NotRequired[T], NotRequired[int]),  # pyright: ignore[reportGeneralTypeIssues]
+        (List[int], List[int]),
+    ],
+)
+def test_substitute(annotation: Any, expected: Any) -> None:
+    view = TypeView(annotation).substitute({T: int})
+
+    assert view == TypeView(expected)
+    assert view.metadata == TypeView(expected).metadata
+    assert view.flags == TypeView(expected).flags
+
+
+def test_substitute_reuses_unchanged_views() -> None:
+    class Repo(Generic[T]): ...
+
+    view = TypeView(Dict[str, Tuple[Repo[T], List[int]]])  # type: ignore[valid-type]  # pyright: ignore[reportGeneralTypeIssues]
+    specialized = view.substitute({T: str})
+
+    assert specialized == TypeView(Dict[str, Tuple[Repo[str], List[int]]])
+    assert specialized.inner_types[0] is view.inner_types[0]
+    assert specialized.inner_types[1].inner_types[1] is view.inner_types[1].inner_types[1]
+    assert TypeView(List[int]).substitute({T: str}) == TypeView(List[int])
+
+    unchanged = TypeView(List[int])
+    assert unchanged.substitute({T: str}) is unchanged
+
+
+def test_substitute_does_not_alter_interned_views() -> None:
+    expanded = TypeView(Dict[T, IntAlias]).strip_type_alias(deep=True)  # type: ignore[valid-type]  # pyright: ignore[reportGeneralTypeIssues]
+    specialized = expanded.substitute({T: str})
+
+    assert repr(specialized) == "TypeView(Dict[str, IntAlias])"
+    assert repr(TypeView.of(Dict[str, int])) == "TypeView(Dict[str, int])"
+    assert TypeView.of(Dict[str, int]).inner_types[1] is TypeView.of(int)
+
+
+def test_substitute_flattened_union() -> None:
+    specialized = TypeView(Union[T, S, int]).substitute({T: int, S: Union[str, bytes]})  # pyright: ignore[reportGeneralTypeIssues]
+
+    assert specialized.args == (int, str, bytes)
+    assert [inner.annotation for inner in specialized.inner_types] == [int, str, bytes]
+    assert TypeView.of(Union[int, str, bytes]).inner_types == (TypeView(int), TypeView(str), TypeView(bytes))
+    assert specialized.is_subtype_of((int, str, bytes))
+    assert specialized.compile_validator()(b"a")
+
+
+def test_with_inner_types() -> None:
+    view = TypeView(Annotated[Dict[str, List[int]], "meta"])
+    rebuilt = view.with_inner_types([TypeView(int), view.inner_types[1]])
+
+    assert rebuilt == TypeView(Dict[int, List[int]])
+    assert rebuilt.metadata == ("meta",)
+    assert rebuilt.inner_types[1] is view.inner_types[1]
+    assert view.with_inner_types(view.inner_types) is view
+
+
+def test_strip_type_alias_is_memoized() -> None:
+    from typing_extensions import TypeAliasType
+
+    Foo = TypeAliasType("Foo", List[int])  # pyright: ignore
+
+    assert TypeView(Foo).strip_type_alias() is TypeView(Foo).strip_type_alias()
+    assert TypeView(Foo).strip_type_alias() == TypeView(List[int])
+
+
+def test_strip_type_alias_deep() -> None:
+    from typing_extensions import TypeAliasType
+
+    IntList = TypeAliasType("IntList", List[int])  # pyright: ignore
+    view = TypeView(Dict[str, Optional[IntList]])
+
+    assert view.strip_type_alias(deep=True) == TypeView(Dict[str, Optional[List[int]]])
+    assert view.strip_type_alias(deep=True) is view.strip_type_alias(deep=True)
+    assert view.strip_type_alias(deep=True).inner_types[0] is view.inner_types[0]
+
+    unchanged = TypeView(Dict[str, int])
+    assert unchanged.strip_type_alias(deep=True) is unchanged
+
+
+def test_strip_type_alias_deep_recursive(json_alias: Any) -> None:
+    view = TypeView(Dict[str, json_alias]).strip_type_alias(deep=True)
+    json = view.inner_types[1]
+
+    assert json.is_union is True
+    assert json.inner_types[2].inner_types[0] is json
+    assert json.inner_types[3].inner_types[1] is json
+    assert TypeView(json_alias).strip_type_alias(deep=True) is json
+    assert repr(view) == "TypeView(Dict[str, Json])"
+    assert json.repr_type.lower() == "union[int, str, list[json], dict[str, json]]"
+    assert view == TypeView(List[Dict[str, json_alias]]).strip_type_alias(deep=True).inner_types[0]
+
+    is_valid = json.compile_validator()
+    assert is_valid({"a": [1, {"b": "c"}]}) is True
+    assert is_valid({"a": [1.0]}) is False
+
+
+def test_pickle_returns_interned_view() -> None:
+    view = TypeView.of(Annotated[Optional[Dict[str, List[int]]], "meta"], metadata=("extra",))
+    view.compile_validator()
+
+    unpickled = pickle.loads(pickle.dumps(view))
+
+    assert unpickled is view
+    assert unpickled.metadata == ("meta", "extra")
+
+
+def test_pickle_keeps_namespaces() -> None:
+    view = TypeView("List[int]", globalns={"List": List}, localns={})
+
+    unpickled = pickle.loads(pickle.dumps(view))
+
+    assert unpickled is not view
+    assert unpickled.resolve() == TypeView(List[int])
+
+
+def test_pickle_refers_to_module_globals_by_name() -> None:
+    view = TypeView("List[int]", globalns=globals())
+
+    unpickled = pickle.loads(pickle.dumps(view))
+
+    assert unpickled._globalns is globals()  # pyright: ignore[reportPrivateUsage]
+    assert unpickled.resolve() == TypeView(List[int])
+
+
+def test_copy_returns_view() -> None:
+    view = TypeView(List[int])
+
+    assert copy.copy(view) is view
+    assert copy.deepcopy(view) is view
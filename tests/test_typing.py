@@ -0,0 +1,107 @@
+# ruff: noqa: UP006
+from __future__ import annotations
+
+import sys
+import types
+from typing import Any, Dict, List, Optional, cast
+
+from typing_extensions import Annotated
+
+from type_lens.typing import (
+    cached_get_type_hints,
+    clear_type_hints_cache,
+    evaluate_forward_ref,
+    get_type_hints,
+    get_type_hints_batch,
+    type_hints_cache_info,
+)
+
+
+def test_evaluate_forward_ref() -> None:
+    assert evaluate_forward_ref("List[int]", {"List": List}) == List[int]
+    assert evaluate_forward_ref("Annotated[int, 1]", localns={"Annotated": Annotated}) == Annotated[int, 1]
+
+
+def test_get_type_hints_batch() -> None:
+    def first(a: int, b: List[Foo]) -> Foo:
+        raise NotImplementedError
+
+    def second(a: List[Foo], b: Optional[str] = None) -> None: ...
+
+    class Foo: ...
+
+    globalns = {**globals(), "Foo": Foo}
+    functions = cast("List[types.FunctionType]", [first, second])
+    assert get_type_hints_batch(functions, globalns) == [
+        get_type_hints(first, globalns=globalns),
+        get_type_hints(second, globalns=globalns),
+    ]
+
+
+def test_cached_get_type_hints() -> None:
+    class Foo:
+        a: int
+        b: Annotated[List[str], "meta"]
+
+    clear_type_hints_cache()
+    hints = cached_get_type_hints(Foo, include_extras=True)
+    assert hints == get_type_hints(Foo, include_extras=True)
+
+    # The cached mapping is not exposed to mutation
+    hints.pop("a")
+    assert cached_get_type_hints(Foo, include_extras=True) == get_type_hints(Foo, include_extras=True)
+    assert cached_get_type_hints(Foo) == {"a": int, "b": List[str]}
+    assert type_hints_cache_info() == (1, 2, 1024, 2)
+
+
+def test_cached_get_type_hints_namespace_fingerprint() -> None:
+    def fn(a: Foo) -> None: ...  # noqa: F821  # pyright: ignore[reportUndefinedVariable, reportUnknownParameterType]
+
+    localns: Dict[str, Any] = {"Foo": int}
+    clear_type_hints_cache()
+    assert cached_get_type_hints(fn, localns=localns) == {"a": int, "return": type(None)}
+
+    # Rebinding a name is not detected...
+    localns["Foo"] = str
+    assert cached_get_type_hints(fn, localns=localns)["a"] is int
+
+    # ...but a change of size, or of namespace, is.
+    localns["Bar"] = bytes
+    assert cached_get_type_hints(fn, localns=localns)["a"] is str
+    assert cached_get_type_hints(fn, localns={"Foo": float})["a"] is float
+
+    clear_type_hints_cache()
+    localns["Foo"] = bool
+    assert cached_get_type_hints(fn, localns=localns)["a"] is bool
+
+
+def test_cached_get_type_hints_annotation_fingerprint() -> None:
+    class Base:
+        a: int
+
+    class Child(Base):
+        b: str
+
+    assert cached_get_type_hints(Child) == {"a": int, "b": str}
+
+    Base.__annotations__["c"] = bytes
+    assert cached_get_type_hints(Child) == {"a": int, "c": bytes, "b": str}
+
+
+def test_cached_get_type_hints_base_module_fingerprint() -> None:
+    module = types.ModuleType("tests.generated_bases")
+    exec("class Base:\n    a: 'Foo'\n\nFoo = int", module.__dict__)
+    sys.modules[module.__name__] = module
+    try:
+
+        class Child(module.Base):  # type: ignore[name-defined,misc]
+            b: str
+
+        clear_type_hints_cache()
+        assert cached_get_type_hints(Child) == {"a": int, "b": str}
+
+        # A change of size of the module of the base is detected, not only of the module of the class.
+        module.__dict__.update(Foo=bytes, Bar=None)
+        assert cached_get_type_hints(Child) == {"a": bytes, "b": str}
+    finally:
+        del sys.modules[module.__name__]
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from typing import Any, List, Optional, TypeVar
+
+import pytest
+from typing_extensions import Annotated, NotRequired, Required
+
+from type_lens.utils import unwrap_annotation
+
+T = TypeVar("T")
+
+
+@pytest.mark.parametrize("annotation", [int, None, "int", T, List[int], Optional[int], Any])
+def test_unwrap_annotation_not_wrapped(annotation: Any) -> None:
+    unwrapped, metadata, wrappers = unwrap_annotation(annotation)
+
+    assert unwrapped is annotation
+    assert metadata == ()
+    assert wrappers == frozenset()
+    # Unwrapped annotations share their empty wrappers.
+    assert wrappers is unwrap_annotation(str)[2]
+
+
+@pytest.mark.parametrize(
+    ("annotation", "expected"),
+    [
+        (Annotated[int, "a", "b"], (int, ("a", "b"), {Annotated})),
+        (Required[Annotated[List[int], "a"]], (List[int], ("a",), {Required, Annotated})),
+        (Annotated[NotRequired[int], "a"], (int, ("a",), {NotRequired, Annotated})),
+    ],
+)
+def test_unwrap_annotation(annotation: Any, expected: Any) -> None:
+    unwrapped, metadata, wrappers = unwrap_annotation(annotation)
+
+    assert (unwrapped, metadata, wrappers) == expected
+    assert isinstance(wrappers, frozenset)
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from abc import ABC
+from collections import abc
+from typing import (
+    Any,
+    Callable,
+    Counter,
+    Dict,
+    ForwardRef,
+    FrozenSet,
+    List,
+    Mapping,
+    NewType,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+import pytest
+from typing_extensions import Annotated, Literal, Protocol, TypeAliasType
+
+from type_lens import TypeView
+from type_lens.exc import TypeViewError
+
+UserId = NewType("UserId", int)
+Number = TypeVar("Number", int, float)
+Bounded = TypeVar("Bounded", bound=str)
+
+
+class Base: ...
+
+
+class Child(Base): ...
+
+
+class NotRuntime(Protocol):
+    def method(self) -> None: ...
+
+
+@pytest.mark.parametrize(
+    ("annotation", "valid", "invalid"),
+    [
+        (int, [1, True], ["1", 1.0, None]),
+        (Any, [1, None, object()], []),
+        (None, [None], [0, ""]),
+        (Optional[int], [1, None], ["1"]),
+        (Union[int, str, None], [1, "a", None], [1.0, b"a"]),
+        (Union[List[int], str], [[1], "a"], [["a"], 1]),
+        (Annotated[int, "meta"], [1], ["1"]),
+        (Literal["a", 1], ["a", 1], ["b", 2, True, 1.0]),
+        (Optional[Literal[True]], [True, None], [1, False]),
+        (Tuple[int, str], [(1, "a")], [(1,), (1, "a", 2), ("a", 1), [1, "a"]]),
+        (Tuple[int, ...], [(), (1, 2, 3)], [(1, "a"), [1]]),
+        (Tuple[()], [()], [(1,)]),
+        (Tuple, [(), (1, "a")], [[1]]),
+        (List[int], [[], [1, 2]], [[1, "a"], (1,), "12"]),
+        (List[Any], [[1, "a"]], [(1,)]),
+        (FrozenSet[str], [frozenset({"a"})], [{"a"}, frozenset({1})]),
+        (Sequence[Optional[int]], [[1, None], (None,)], [[1.0], {1}]),
+        (Dict[str, List[int]], [{}, {"a": [1]}], [{"a": ["b"]}, {1: [1]}, [("a", [1])]]),
+        (Dict[str, Any], [{"a": object()}], [{1: 1}]),
+        (Mapping[Any, int], [{"a": 1}], [{"a": "b"}]),
+        (Counter[str], [Counter("ab")], [Counter([1]), {"a": 1}]),
+        (Type[Base], [Base, Child], [Base(), int]),
+        (Callable[[int], str], [len, lambda: None], [1]),
+        (UserId, [UserId(1)], ["1"]),
+        (Number, [1, 1.0], ["1"]),
+        (Bounded, ["a"], [1]),
+        (abc.Sized, [[1], "a"], [1]),
+    ],
+)
+def test_compile_validator(annotation: Any, valid: list[Any], invalid: list[Any]) -> None:
+    is_valid = TypeView(annotation).compile_validator()
+
+    assert all(is_valid(value) for value in valid)
+    assert not any(is_valid(value) for value in invalid)
+
+
+def test_compile_validator_is_memoized() -> None:
+    view = TypeView(List[int])
+
+    assert view.compile_validator() is view.compile_validator()
+
+
+def test_compile_validator_resolves_forward_references() -> None:
+    is_valid = TypeView(List["Base"], globalns=globals()).compile_validator()
+
+    assert is_valid([Child()])
+    assert not is_valid([1])
+
+
+@pytest.mark.parametrize("annotation", [NotRuntime, List[NotRuntime], List[ForwardRef("Missing")]])  # type: ignore[misc]
+def test_compile_validator_unsupported(annotation: Any) -> None:
+    with pytest.raises(TypeViewError):
+        TypeView(annotation).compile_validator()
+
+
+def test_compile_validator_type_alias() -> None:
+    IntList = TypeAliasType("IntList", List[int])  # pyright: ignore
+    is_valid = TypeView(Optional[IntList]).compile_validator()
+
+    assert is_valid([1]) and is_valid(None)
+    assert not is_valid(["a"])
+
+
+class Registered(ABC): ...
+
+
+Registered.register(float)
+
+
+@pytest.mark.parametrize(
+    ("annotation", "value", "expected"),
+    [
+        (Union[int, str], 1, int),
+        (Union[int, str], "a", str),
+        (Union[int, str], True, int),
+        (Union[int, str], 1.0, None),
+        (Union[Base, int], Child(), Base),
+        (Union[Child, Base], Child(), Child),
+        (Union[Registered, int], 1.0, Registered),
+        (Union[Literal["a", "b"], str], "a", Literal["a", "b"]),
+        (Union[Literal["a", "b"], str], "c", str),
+        (Union[Literal[1], bool], True, bool),
+        (Union[List[int], List[str]], ["a"], List[str]),
+        (Optional[Annotated[int, "meta"]], None, type(None)),
+        (int, 1, int),
+        (int, "1", None),
+    ],
+)
+def test_union_dispatcher(annotation: Any, value: Any, expected: Any) -> None:
+    dispatcher = TypeView(annotation).union_dispatcher()
+
+    match = dispatcher.match(value)
+    assert (match and match.annotation) == (expected and TypeView(expected).annotation)
+    # Memoized class lookups give the same result.
+    assert dispatcher.match(value) is match
+
+
+def test_union_dispatcher_returns_member_views() -> None:
+    view = TypeView(Union[Annotated[int, "meta"], str])
+    dispatcher = view.union_dispatcher()
+
+    assert view.union_dispatcher() is dispatcher
+    assert dispatcher.match(1) is view.inner_types[0]
+    assert dispatcher.match(1).metadata == ("meta",)  # type: ignore[union-attr]
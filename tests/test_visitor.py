@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import pytest
+from typing_extensions import Annotated, TypeAliasType
+
+from type_lens import TypeView
+from type_lens.exc import TypeViewError
+from type_lens.visitor import TypeViewTransformer, TypeViewVisitor
+
+
+class CountVisits(TypeViewVisitor[int]):
+    def __init__(self) -> None:
+        super().__init__()
+        self.visited: list[TypeView[Any]] = []
+
+    def visit_view(self, view: TypeView[Any], children: Iterator[int]) -> int:
+        self.visited.append(view)
+        return 1 + sum(children)
+
+    def visit_cycle(self, view: TypeView[Any]) -> int:
+        return 0
+
+
+class Depth(TypeViewVisitor[int]):
+    def visit_view(self, view: TypeView[Any], children: Iterator[int]) -> int:
+        return 1 + max(children, default=0)
+
+
+class HasInt(TypeViewVisitor[bool]):
+    def visit_view(self, view: TypeView[Any], children: Iterator[bool]) -> bool:
+        return view.annotation is int or any(children)
+
+
+class IntToStr(TypeViewTransformer):
+    def transform(self, view: TypeView[Any]) -> TypeView[Any]:
+        return TypeView(str) if view.annotation is int else view
+
+
+def test_visitor_requires_visit_view() -> None:
+    with pytest.raises(TypeError):
+        TypeViewVisitor()  # type: ignore[abstract]  # pyright: ignore[reportAbstractUsage]
+
+
+def test_visitor_memoizes_shared_views() -> None:
+    shared = TypeView.of(List[int])
+    view = TypeView(Tuple[List[int], List[int]])
+    assert view.inner_types[0] is view.inner_types[1] is shared
+
+    visitor = CountVisits()
+    assert visitor.visit(view) == 5
+    assert visitor.visited.count(shared) == 1
+
+
+def test_visitor_early_exit() -> None:
+    visitor = HasInt()
+    view = TypeView(Union[int, List[str]])
+
+    assert visitor.visit(view) is True
+    assert id(view.inner_types[1]) not in visitor._memo  # pyright: ignore[reportPrivateUsage]
+
+
+def test_visitor_recursive_alias(json_alias: Any) -> None:
+    visitor = CountVisits()
+
+    assert visitor.visit(TypeView(Optional[json_alias])) > 0
+    with pytest.raises(TypeViewError, match="Recursive type"):
+        Depth().visit(TypeView(json_alias))
+
+    expanded = TypeView(json_alias).strip_type_alias(deep=True)
+    assert CountVisits().visit(expanded) == CountVisits().visit(TypeView(json_alias)) - 1
+    with pytest.raises(TypeViewError, match="Recursive type"):
+        Depth().visit(expanded)
+
+
+@pytest.mark.parametrize(
+    ("annotation", "expected"),
+    [
+        (int, str),
+        (Dict[str, List[int]], Dict[str, List[str]]),
+        (Optional[Tuple[int, ...]], Optional[Tuple[str, ...]]),
+        (Annotated[List[int], "meta"], Annotated[List[str], "meta"]),
+    ],
+)
+def test_transformer(annotation: Any, expected: Any) -> None:
+    view = IntToStr().visit(TypeView(annotation))
+
+    assert view == TypeView(expected)
+    assert view.metadata == TypeView(expected).metadata
+
+
+def test_transformer_keeps_unchanged_views() -> None:
+    view = TypeView(Dict[str, Tuple[List[int], bytes]])
+    transformed = IntToStr().visit(view)
+
+    assert transformed.inner_types[0] is view.inner_types[0]
+    assert transformed.inner_types[1].inner_types[1] is view.inner_types[1].inner_types[1]
+
+    unchanged = TypeView(Dict[str, List[bytes]])
+    assert IntToStr().visit(unchanged) is unchanged
+
+
+IntList = TypeAliasType("IntList", List[int])
+
+
+def test_transformer_type_alias(json_alias: Any) -> None:
+    assert IntToStr().visit(TypeView(IntList)) == TypeView(List[str])
+    unchanged = TypeView(json_alias)
+    assert TypeViewTransformer().visit(unchanged) is unchanged
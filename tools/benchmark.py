@@ -0,0 +1,225 @@
+"""Benchmark the hot paths of type-lens and compare the results against a stored baseline.
+
+Run ``make benchmark`` to check for regressions, and ``make benchmark-baseline`` to record a new baseline after an
+intentional change. Timings are recorded relative to a calibration benchmark of the standard library, timed in the
+same run, so that a baseline recorded on one machine can be checked on another. They still depend on the version of
+Python, and a baseline is best recorded on the version used to check it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import inspect
+import json
+import pickle
+import platform
+import sys
+import timeit
+import types
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union
+
+from typing_extensions import Annotated
+
+from type_lens import CallableView, TypeView
+from type_lens.typing import cached_get_type_hints, get_type_hints
+from type_lens.utils import unwrap_annotation
+
+DEFAULT_OUTPUT = Path(".benchmarks/results.json")
+DEFAULT_BASELINE = Path(__file__).parent / "benchmark_baseline.json"
+
+DEEP_GENERIC = Optional[Dict[str, List[Tuple[Dict[str, List[int]], ...]]]]
+LARGE_UNION = Union[tuple(type(f"Member{i}", (), {}) for i in range(32))]  # type: ignore[misc]
+ANNOTATED = Annotated[Optional[List[Annotated[int, "item"]]], "min_length", 1, "max_length", 100]
+LARGE_LITERAL = Literal[tuple(f"value_{i}" for i in range(250))]  # type: ignore[misc]
+
+_HANDLERS_SOURCE = """
+from __future__ import annotations
+
+from typing import Dict, List, Optional
+
+from typing_extensions import Annotated
+
+
+class Model: ...
+
+
+class Handlers:
+    def handle(
+        self,
+        {parameters},
+    ) -> Dict[str, List[Model]]: ...
+"""
+_PARAMETER_TYPES = ("int", "str", "Optional[Model]", "List[int]", "Dict[str, Model]", "Annotated[int, 'meta']")
+_HANDLERS = types.ModuleType("benchmark_handlers")
+# Registered so that the handlers, and views of them, can be pickled by reference.
+sys.modules[_HANDLERS.__name__] = _HANDLERS
+exec(  # noqa: S102
+    _HANDLERS_SOURCE.format(
+        parameters=",\n        ".join(
+            f"p{i}: {_PARAMETER_TYPES[i % len(_PARAMETER_TYPES)]}" + (" = None" if i >= 12 else "") for i in range(24)
+        )
+    ),
+    _HANDLERS.__dict__,
+)
+METHOD = _HANDLERS.Handlers.handle
+METHOD_VIEW = CallableView.from_callable(METHOD, include_extras=True)
+METHOD_SIGNATURE = inspect.signature(METHOD)
+METHOD_KWARGS = {f"p{i}": i for i in range(24)}
+METHOD_VIEW_PICKLE = pickle.dumps(METHOD_VIEW)
+HANDLER_FUNCTIONS = [
+    types.FunctionType(METHOD.__code__, METHOD.__globals__, f"handler_{i}", METHOD.__defaults__) for i in range(50)
+]
+for _function in HANDLER_FUNCTIONS:
+    _function.__annotations__ = METHOD.__annotations__
+
+
+ANNOTATIONS: dict[str, Any] = {
+    "deep_generic": DEEP_GENERIC,
+    "large_union": LARGE_UNION,
+    "annotated": ANNOTATED,
+    "large_literal": LARGE_LITERAL,
+}
+VIEWS = {name: TypeView(annotation) for name, annotation in ANNOTATIONS.items()}
+DEEP_GENERIC_VALUE = {f"key_{i}": [({"a": list(range(10))},) * 3] for i in range(10)}
+OPTIONAL_UNION_VIEW = TypeView(Optional[Union[int, str, bytes, List[int]]])
+DISPATCHER = VIEWS["large_union"].union_dispatcher()
+LAST_MEMBER = LARGE_UNION.__args__[-1]()
+VALIDATORS = {name: view.compile_validator() for name, view in VIEWS.items() if name != "large_union"}
+
+BENCHMARKS: dict[str, Callable[[], object]] = {
+    **{f"construct[{name}]": (lambda a=annotation: TypeView(a)) for name, annotation in ANNOTATIONS.items()},
+    **{f"construct_of[{name}]": (lambda a=annotation: TypeView.of(a)) for name, annotation in ANNOTATIONS.items()},
+    **{
+        f"construct_tree[{name}]": (lambda a=annotation: _walk(TypeView(a))) for name, annotation in ANNOTATIONS.items()
+    },
+    "unwrap_annotation[plain]": lambda: unwrap_annotation(int),
+    "unwrap_annotation[annotated]": lambda: unwrap_annotation(ANNOTATIONS["annotated"]),
+    "predicates[deep_generic]": lambda: _predicates(VIEWS["deep_generic"]),
+    "predicates[large_union]": lambda: _predicates(VIEWS["large_union"]),
+    "is_subtype_of[large_union]": lambda: VIEWS["large_union"].is_subtype_of(int),
+    "strip_optional[annotated]": VIEWS["annotated"].strip_optional,
+    "strip_optional[optional_union]": OPTIONAL_UNION_VIEW.strip_optional,
+    "validate[deep_generic]": lambda: VALIDATORS["deep_generic"](DEEP_GENERIC_VALUE),
+    "validate[annotated]": lambda: VALIDATORS["annotated"](list(range(100))),
+    "validate[large_literal]": lambda: VALIDATORS["large_literal"]("value_249"),
+    "has_literal_value[large_literal]": lambda: VIEWS["large_literal"].has_literal_value("value_249"),
+    "dispatch[large_union]": lambda: DISPATCHER.match(LAST_MEMBER),
+    "get_type_hints[24_params]": lambda: get_type_hints(METHOD, include_extras=True),
+    "cached_get_type_hints[24_params]": lambda: cached_get_type_hints(METHOD, include_extras=True),
+    "from_callable[24_params]": lambda: CallableView.from_callable(METHOD, include_extras=True),
+    "from_callable_cached[24_params]": lambda: CallableView.from_callable(METHOD, include_extras=True, cache=True),
+    "signature_bind[24_params]": lambda: METHOD_SIGNATURE.bind(None, **METHOD_KWARGS).arguments,
+    "bind[24_params]": lambda: METHOD_VIEW.bind(None, **METHOD_KWARGS),
+    "unpickle[24_params]": lambda: pickle.loads(METHOD_VIEW_PICKLE),  # noqa: S301
+    "from_many[50_handlers]": lambda: CallableView.from_many(HANDLER_FUNCTIONS, include_extras=True),
+}
+
+
+def _walk(view: TypeView[Any]) -> None:
+    for inner in view.inner_types:
+        _walk(inner)
+
+
+def _predicates(view: TypeView[Any]) -> None:
+    for _ in range(10):
+        _ = (
+            view.is_union,
+            view.is_optional,
+            view.is_literal,
+            view.is_collection,
+            view.is_mapping,
+            view.is_tuple,
+            view.is_non_string_collection,
+        )
+
+
+CALIBRATION: Callable[[], object] = partial(inspect.signature, METHOD)
+"""A benchmark of the standard library only, that scales the timings to the speed of the machine."""
+
+
+def run(names: list[str] | None = None, repeat: int = 5) -> dict[str, float]:
+    """Time each benchmark, returning the best time per call relative to the best time of :data:`CALIBRATION`.
+
+    The calibration is timed in turn with each benchmark, so that a change of the speed of the machine during the run
+    affects both timings alike.
+    """
+    calibration = timeit.Timer(CALIBRATION)
+    calibration_number, _ = calibration.autorange()
+    results = {}
+    for name, fn in BENCHMARKS.items():
+        if names and not any(n in name for n in names):
+            continue
+        timer = timeit.Timer(fn)
+        number, _ = timer.autorange()
+        best = best_calibration = float("inf")
+        for _ in range(repeat):
+            best_calibration = min(best_calibration, calibration.timeit(calibration_number) / calibration_number)
+            best = min(best, timer.timeit(number) / number)
+        results[name] = best / best_calibration
+        _report(f"{name:<40} {best * 1e6:>12.3f} us {results[name]:>12.3f}x")
+    return results
+
+
+def compare(results: dict[str, float], baseline: dict[str, float], threshold: float) -> list[str]:
+    """Print the ratio of each result to its baseline, returning the names of the regressed benchmarks."""
+    regressions = []
+    _report(f"\n{'benchmark':<40} {'baseline':>12} {'current':>12} {'ratio':>8}")
+    for name, current in results.items():
+        if name not in baseline:
+            continue
+        ratio = current / baseline[name]
+        marker = "  REGRESSION" if ratio > threshold else ""
+        _report(f"{name:<40} {baseline[name]:>11.3f}x {current:>11.3f}x {ratio:>8.2f}{marker}")
+        if ratio > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def _report(line: str) -> None:
+    sys.stdout.write(f"{line}\n")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-k", dest="names", action="append", help="Only run benchmarks whose name contains this.")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Where to write the results as JSON.")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="The baseline to compare against.")
+    parser.add_argument("--save-baseline", action="store_true", help="Write the results as the new baseline.")
+    parser.add_argument("--threshold", type=float, default=1.25, help="Slowdown ratio that counts as a regression.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timing repeats; the best is kept.")
+    args = parser.parse_args()
+
+    results = run(args.names, args.repeat)
+    report = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2) + "\n")
+    _report(f"\nResults written to {args.output}")
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+        _report(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        _report(f"No baseline at {args.baseline}, run with --save-baseline to record one.")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    if baseline["python"].rsplit(".", 1)[0] != report["python"].rsplit(".", 1)[0]:
+        _report(f"Warning: the baseline was recorded on Python {baseline['python']}, not {report['python']}.")
+    regressions = compare(results, baseline["results"], args.threshold)
+    if regressions:
+        _report(f"\n{len(regressions)} benchmark(s) regressed by more than {args.threshold:.2f}x.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
 from .callable_view import CallableView
+from .class_view import ClassView
+from .field_view import FieldView
 from .parameter_view import ParameterView
-from .type_view import TypeView
+from .type_view import TypeView, TypeViewFlag
 from .types.empty import Empty, EmptyType
 
 __all__ = (
     "CallableView",
+    "ClassView",
     "Empty",
     "EmptyType",
+    "FieldView",
     "ParameterView",
     "TypeView",
+    "TypeViewFlag",
 )
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import sys
+from inspect import Parameter
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Final, Iterator, Mapping, Tuple
+
+from type_lens.types.empty import Empty
+
+__all__ = ("BindingPlan",)
+
+
+if TYPE_CHECKING:
+    from typing import Iterable
+
+    from type_lens.parameter_view import ParameterView
+
+_POSITIONAL_KINDS: Final = (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
+_KEYWORD_KINDS: Final = (Parameter.POSITIONAL_OR_KEYWORD, Parameter.KEYWORD_ONLY)
+
+_Parameter = Tuple[str, Any, Any]
+
+_NO_KEYWORDS: Final[frozenset[str]] = frozenset()
+
+_REPORT_KEYWORD_ONLY: Final = sys.version_info >= (3, 12)
+"""Whether ``Signature.bind`` reports missing keyword-only parameters as such."""
+
+_DEFER_POSITIONAL_ONLY_ERROR: Final = sys.version_info >= (3, 13)
+"""Whether ``Signature.bind`` lets a ``**kwargs`` parameter collect positional-only parameters passed as keywords."""
+
+
+class BindingPlan:
+    """Precomputed layout of the parameters of a callable, to bind arguments without :meth:`inspect.Signature.bind`."""
+
+    __slots__ = {
+        "names": "Names of the parameters, in order, excluding variadic parameters.",
+        "positional": "Names of the parameters that accept positional arguments, in order.",
+        "keywords": "Names of the parameters that accept keyword arguments.",
+        "positional_only": "Names of the positional-only parameters.",
+        "defaults": "Default values of the parameters in ``names``, or :data:`Empty` for required parameters.",
+        "var_positional": "Name of the ``*args`` parameter, if any.",
+        "var_keyword": "Name of the ``**kwargs`` parameter, if any.",
+        "_order": "Names of all parameters, including variadic parameters, in order.",
+        "_parameters": "Name, kind and default value of all parameters, in order.",
+        "_required": "Names of the parameters without a default value.",
+    }
+
+    def __init__(self, parameters: Iterable[ParameterView]) -> None:
+        """Initialize BindingPlan.
+
+        Args:
+            parameters: Views of the parameters of the callable, in order.
+        """
+        parameters = tuple(parameters)
+        self.var_positional: Final = next((p.name for p in parameters if p.kind is Parameter.VAR_POSITIONAL), None)
+        self.var_keyword: Final = next((p.name for p in parameters if p.kind is Parameter.VAR_KEYWORD), None)
+
+        bindable = [p for p in parameters if p.kind in _POSITIONAL_KINDS or p.kind is Parameter.KEYWORD_ONLY]
+        self.names: Final = tuple(p.name for p in bindable)
+        self.positional: Final = tuple(p.name for p in bindable if p.kind in _POSITIONAL_KINDS)
+        self.keywords: Final = frozenset(p.name for p in bindable if p.kind in _KEYWORD_KINDS)
+        self.positional_only: Final = frozenset(p.name for p in bindable if p.kind is Parameter.POSITIONAL_ONLY)
+        self.defaults: Final = tuple(p.default for p in bindable)
+        self._order: Final = tuple(p.name for p in parameters)
+        self._parameters: Final = tuple((p.name, p.kind, p.default) for p in parameters)
+        self._required: Final = frozenset(p.name for p in bindable if p.default is Empty)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({', '.join(self._order)})"
+
+    def bind(
+        self,
+        args: tuple[Any, ...] = (),
+        kwargs: Mapping[str, Any] | None = None,
+        *,
+        apply_defaults: bool = False,
+    ) -> dict[str, Any]:
+        """Bind arguments to the parameters, like ``Signature.bind(*args, **kwargs).arguments``.
+
+        Args:
+            args: The positional arguments.
+            kwargs: The keyword arguments.
+            apply_defaults: Whether to also bind the default values of the missing parameters, and empty variadic
+                arguments, like :meth:`inspect.BoundArguments.apply_defaults`.
+
+        Returns:
+            A mapping of parameter names to bound values, in the order of the parameters.
+
+        Raises:
+            TypeError: If the arguments do not match the parameters, with the message that ``Signature.bind`` raises
+                on the running version of Python.
+        """
+        positional = self.positional
+        if apply_defaults or (len(args) > len(positional) and self.var_positional is None):
+            return self._bind(args, dict(kwargs) if kwargs else {}, apply_defaults)
+        if not kwargs and len(args) == len(positional) == len(self.names):
+            # Fast path: every parameter is bound positionally.
+            return dict(zip(positional, args))
+
+        bound = dict(zip(positional, args))
+        keys = kwargs.keys() if kwargs else _NO_KEYWORDS
+        if keys <= self.keywords and keys.isdisjoint(bound) and not self._required - keys - bound.keys():
+            # Fast path: keyword arguments bind to distinct parameters, and no required parameter is missing.
+            if kwargs:
+                bound.update(kwargs)
+            if len(args) > len(positional):
+                bound[self.var_positional] = args[len(positional) :]  # type: ignore[index]
+            return {name: bound[name] for name in self._order if name in bound}
+        return self._bind(args, dict(kwargs) if kwargs else {}, apply_defaults)
+
+    def _bind(self, args: tuple[Any, ...], kwargs: dict[str, Any], apply_defaults: bool) -> dict[str, Any]:
+        """Bind arguments with the algorithm of ``Signature.bind``, so that invalid arguments raise the same error."""
+        bound: dict[str, Any] = {}
+        parameters, deferred = self._bind_positional(args, kwargs, bound)
+        self._bind_keywords(parameters, kwargs, bound, deferred)
+        if apply_defaults:
+            for name, kind, default in self._parameters:
+                if name in bound:
+                    continue
+                if default is not Empty:
+                    bound[name] = default
+                elif kind is Parameter.VAR_POSITIONAL:
+                    bound[name] = ()
+                elif kind is Parameter.VAR_KEYWORD:
+                    bound[name] = {}
+        return {name: bound[name] for name in self._order if name in bound}
+
+    def _bind_positional(
+        self,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        bound: dict[str, Any],
+    ) -> tuple[Iterator[_Parameter], list[str]]:
+        """Bind the positional arguments, returning the parameters left to bind by keyword.
+
+        Also returns the names of the positional-only parameters passed as keywords, that Python 3.13+ only reports
+        once it is sure that no ``**kwargs`` parameter collects them.
+        """
+        parameters = iter(self._parameters)
+        deferred: list[str] = []
+        for index, value in enumerate(args):
+            parameter = next(parameters, None)
+            if parameter is None or parameter[1] in (Parameter.KEYWORD_ONLY, Parameter.VAR_KEYWORD):
+                raise TypeError("too many positional arguments")
+            name, kind, _ = parameter
+            if kind is Parameter.VAR_POSITIONAL:
+                bound[name] = tuple(args[index:])
+                return parameters, deferred
+            if name in kwargs and kind is not Parameter.POSITIONAL_ONLY:
+                raise TypeError(f"multiple values for argument {name!r}")
+            bound[name] = value
+
+        for parameter in parameters:
+            name, kind, default = parameter
+            if kind is Parameter.VAR_POSITIONAL:
+                break
+            if name in kwargs and kind is Parameter.POSITIONAL_ONLY:
+                if not _DEFER_POSITIONAL_ONLY_ERROR:
+                    raise TypeError(f"{name!r} parameter is positional only, but was passed as a keyword")
+                deferred.append(name)
+            elif name in kwargs or kind is Parameter.VAR_KEYWORD or default is not Empty:
+                return chain((parameter,), parameters), deferred
+            else:
+                keyword_only = _REPORT_KEYWORD_ONLY and kind is Parameter.KEYWORD_ONLY
+                argument = "keyword-only argument" if keyword_only else "argument"
+                raise TypeError(f"missing a required {argument}: {name!r}")
+        return parameters, deferred
+
+    def _bind_keywords(
+        self,
+        parameters: Iterable[_Parameter],
+        kwargs: dict[str, Any],
+        bound: dict[str, Any],
+        deferred: list[str],
+    ) -> None:
+        """Bind the keyword arguments to the remaining parameters, collecting the others into ``**kwargs``."""
+        var_keyword = None
+        for name, kind, default in parameters:
+            if kind is Parameter.VAR_KEYWORD:
+                var_keyword = name
+            elif kind is Parameter.VAR_POSITIONAL:
+                continue
+            elif name in kwargs:
+                if kind is Parameter.POSITIONAL_ONLY and not _DEFER_POSITIONAL_ONLY_ERROR:
+                    raise TypeError(f"{name!r} parameter is positional only, but was passed as a keyword")
+                bound[name] = kwargs.pop(name)
+            elif default is Empty:
+                raise TypeError(f"missing a required argument: {name!r}")
+
+        if not kwargs:
+            return
+        if var_keyword is not None:
+            bound[var_keyword] = kwargs
+        elif deferred:
+            names = ", ".join(deferred)
+            raise TypeError(f"got some positional-only arguments passed as keyword arguments: {names!r}")
+        else:
+            raise TypeError(f"got an unexpected keyword argument {next(iter(kwargs))!r}")
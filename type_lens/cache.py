@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import threading
+from typing import Callable, Generic, Hashable, NamedTuple, TypeVar
+from weakref import WeakKeyDictionary
+
+__all__ = ("BoundedCache", "CacheInfo", "WeakKeyCache")
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a cache, mirroring :func:`functools.lru_cache`'s ``cache_info()``."""
+
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
+class BoundedCache(Generic[K, V]):
+    """A bounded, thread-safe mapping that evicts its oldest entry when full.
+
+    Lookups do not take the lock, nor track recency: the caches of this library sit on hot paths where a lookup must
+    cost little more than a ``dict`` access, and their working sets are expected to fit well within the bound. A
+    lookup is a single ``dict`` access, which is atomic with or without the GIL, so it observes either the state
+    before or after a concurrent write. The hit and miss statistics are updated without the lock, and may undercount
+    concurrent lookups.
+    """
+
+    __slots__ = {
+        "maxsize": "The maximum number of entries held, or ``None`` for an unbounded cache.",
+        "_data": "The cached entries, in insertion order.",
+        "_hits": "Number of successful lookups.",
+        "_lock": "Lock serializing writes to the cache.",
+        "_misses": "Number of failed lookups.",
+    }
+
+    def __init__(self, maxsize: int | None = 1024) -> None:
+        """Initialize BoundedCache.
+
+        Args:
+            maxsize: The maximum number of entries to hold, or ``None`` to never evict.
+        """
+        self.maxsize = maxsize
+        self._data: dict[K, V] = {}
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(maxsize={self.maxsize!r}, currsize={len(self._data)})"
+
+    def get(self, key: K) -> V | None:
+        """Retrieve a cached value.
+
+        Args:
+            key: The key to look up.
+
+        Returns:
+            The cached value, or ``None`` on a cache miss.
+        """
+        try:
+            value = self._data[key]
+        except KeyError:
+            self._misses += 1
+            return None
+        self._hits += 1
+        return value
+
+    def set(self, key: K, value: V) -> V:
+        """Store a value, evicting the oldest entry if the cache is full.
+
+        If another thread stored a value for ``key`` first, that value is kept so that every caller observes the
+        same instance.
+
+        Args:
+            key: The key to store the value under.
+            value: The value to store.
+
+        Returns:
+            The value held by the cache for ``key``.
+        """
+        with self._lock:
+            existing = self._data.get(key)
+            if existing is not None:
+                return existing
+            if self.maxsize is not None and len(self._data) >= self.maxsize:
+                del self._data[next(iter(self._data))]
+            self._data[key] = value
+            return value
+
+    def pop(self, key: K) -> V | None:
+        """Remove and return a cached value, if present."""
+        with self._lock:
+            return self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self._hits = self._misses = 0
+
+    def info(self) -> CacheInfo:
+        """Report the cache statistics."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._data))
+
+
+class WeakKeyCache(Generic[K, V]):
+    """A thread-safe mapping that holds weak references to its keys, dropping entries along with their key.
+
+    Keys that cannot be weakly referenced raise :exc:`TypeError` from :meth:`get` and :meth:`set`. As with
+    :class:`BoundedCache`, lookups do not take the lock, and the hit and miss statistics may undercount concurrent
+    lookups.
+    """
+
+    __slots__ = {
+        "_data": "The cached entries.",
+        "_hits": "Number of successful lookups.",
+        "_lock": "Lock serializing writes to the cache.",
+        "_misses": "Number of failed lookups.",
+    }
+
+    def __init__(self) -> None:
+        self._data: WeakKeyDictionary[K, V] = WeakKeyDictionary()
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(currsize={len(self._data)})"
+
+    def get(self, key: K, is_valid: Callable[[V], bool] | None = None) -> V | None:
+        """Retrieve a cached value.
+
+        Args:
+            key: The key to look up.
+            is_valid: Optional check of whether the cached value is still current. Stale values count as a miss.
+
+        Returns:
+            The cached value, or ``None`` on a cache miss.
+        """
+        value = self._data.get(key)
+        if value is None or (is_valid is not None and not is_valid(value)):
+            self._misses += 1
+            return None
+        self._hits += 1
+        return value
+
+    def set(self, key: K, value: V) -> V:
+        """Store a value, replacing any value already held for ``key``.
+
+        Args:
+            key: The key to store the value under.
+            value: The value to store.
+
+        Returns:
+            The stored value.
+        """
+        with self._lock:
+            self._data[key] = value
+            return value
+
+    def pop(self, key: K) -> V | None:
+        """Remove and return a cached value, if present."""
+        with self._lock:
+            return self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self._hits = self._misses = 0
+
+    def info(self) -> CacheInfo:
+        """Report the cache statistics."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, None, len(self._data))
@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import inspect
 import types
-from typing import TYPE_CHECKING, Any, Callable
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Dict, Final, Iterable, Optional, Tuple
 
+from type_lens.binding import BindingPlan
+from type_lens.cache import CacheInfo, WeakKeyCache
 from type_lens.parameter_view import ParameterView
 from type_lens.type_view import TypeView
-from type_lens.typing import get_type_hints
+from type_lens.typing import get_type_hints, get_type_hints_batch
 
 __all__ = ("CallableView",)
 
@@ -14,6 +17,18 @@ __all__ = ("CallableView",)
 if TYPE_CHECKING:
     from typing_extensions import Self
 
+_Fingerprint = Tuple[Optional[Dict[str, Any]], Any, Any]
+_Options = Tuple[type, bool]
+
+_VARIADIC_KINDS: Final = (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+
+_VIEW_CACHE: Final[WeakKeyCache[Callable[..., Any], tuple[_Fingerprint, _Options, CallableView]]] = WeakKeyCache()
+"""Views built by :meth:`CallableView.from_callable` with ``cache=True``, keyed by the callable.
+
+The cached views are detached from their callable, as a strong reference from a value to its key would keep the entry
+alive forever.
+"""
+
 
 class CallableView:
     """Represents a callable's signature, including all parameters and return type."""
@@ -30,12 +45,14 @@ class CallableView:
         self.signature = getattr(fn, "__signature__", None) or inspect.signature(fn)
 
         return_annotation = type_hints.pop("return", None)
-        self.return_type = TypeView(return_annotation)
+        self.return_type = TypeView.of(return_annotation)
 
         self.parameters = tuple(
             ParameterView.from_parameter(param, type_hints) for param in self.signature.parameters.values()
         )
 
+        self._index_parameters()
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, CallableView):
             return False
@@ -51,6 +68,12 @@ class CallableView:
 
         return f"{cls_name}({self.callable.__name__})"
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Views are pickled with their resolved parameters, so that unpickling does not introspect the callable
+        # again. The callable is pickled by reference, and the views of the annotations through ``TypeView.of``.
+        state = (self.signature, self.return_type, self.parameters)
+        return _unpickle_callable_view, (self.__class__, self.callable, state)
+
     @classmethod
     def from_callable(
         cls: type[Self],
@@ -59,6 +82,7 @@ class CallableView:
         globalns: dict[str, Any] | None = None,
         localns: dict[str, Any] | None = None,
         include_extras: bool = False,
+        cache: bool = False,
     ) -> Self:
         """Construct a :class:`CallableView` from a callable, resolving type hints automatically.
 
@@ -67,9 +91,13 @@ class CallableView:
             globalns: Optional global namespace for resolving forward references.
             localns: Optional local namespace for resolving forward references.
             include_extras: Whether to preserve ``Annotated`` metadata in resolved type hints.
+            cache: Whether to reuse the view built by a previous call for the same callable and arguments. Cached
+                views are held only as long as the callable is alive, and are rebuilt once the callable's
+                ``__annotations__``, ``__signature__`` or ``__wrapped__`` change. Callables that cannot be weakly
+                referenced, and calls that pass ``globalns`` or ``localns``, are not cached.
 
         Returns:
-            A new :class:`CallableView` instance.
+            A :class:`CallableView` instance.
         """
         hint_fn = fn
         if not isinstance(fn, (type, types.FunctionType)):
@@ -79,5 +107,197 @@ class CallableView:
 
             hint_fn = callable_
 
-        result = get_type_hints(hint_fn, globalns=globalns, localns=localns, include_extras=include_extras)
-        return cls(fn, result)
+        # Explicit namespaces bypass the cache: they may well reference ``fn``, so an entry referencing them would
+        # keep ``fn`` alive, and their ids may be reused once they are collected.
+        if not cache or globalns is not None or localns is not None:
+            result = get_type_hints(hint_fn, globalns=globalns, localns=localns, include_extras=include_extras)
+            return cls(fn, result)
+
+        fingerprint = _fingerprint(fn, hint_fn)
+        options: _Options = (cls, include_extras)
+
+        def is_valid(entry: tuple[_Fingerprint, _Options, CallableView]) -> bool:
+            return entry[1] == options and _is_current(entry[0], fingerprint)
+
+        try:
+            entry = _VIEW_CACHE.get(fn, is_valid)
+        except TypeError:  # not weakly referenceable
+            return cls.from_callable(fn, include_extras=include_extras)
+        if entry is not None:
+            return entry[2]._attach(fn)  # type: ignore[return-value]
+
+        view = cls.from_callable(fn, include_extras=include_extras)
+        annotations, signature, wrapped = fingerprint
+        # Annotations can be mutated in place, so compare later calls against a snapshot.
+        snapshot = dict(annotations) if annotations is not None else None
+        _VIEW_CACHE.set(fn, ((snapshot, signature, wrapped), options, view._attach(None)))
+        return view
+
+    @classmethod
+    def from_many(
+        cls: type[Self],
+        fns: Iterable[Callable[..., Any]],
+        *,
+        include_extras: bool = False,
+    ) -> dict[Callable[..., Any], Self]:
+        """Construct views of many callables at once, sharing work between those defined in the same module.
+
+        Plain functions are grouped by their ``__globals__``, and the annotations of each group are resolved in a
+        single pass that evaluates every distinct annotation once. Other callables, and functions that declare type
+        parameters, are introspected one by one with :meth:`from_callable`.
+
+        Args:
+            fns: The callables to introspect.
+            include_extras: Whether to preserve ``Annotated`` metadata in resolved type hints.
+
+        Returns:
+            A mapping of each callable to its view, in the order of ``fns``.
+        """
+        fns = list(fns)
+        views: dict[Callable[..., Any], Self] = {}
+        groups: dict[int, tuple[dict[str, Any], list[types.FunctionType]]] = {}
+        for fn in fns:
+            if isinstance(fn, types.FunctionType) and not getattr(fn, "__type_params__", None):
+                globalns = inspect.unwrap(fn).__globals__
+                groups.setdefault(id(globalns), (globalns, []))[1].append(fn)
+            else:
+                views[fn] = cls.from_callable(fn, include_extras=include_extras)
+
+        for globalns, group in groups.values():
+            try:
+                hints = get_type_hints_batch(group, globalns, include_extras=include_extras)
+            except Exception:  # noqa: BLE001
+                # Let a failing callable raise on its own, or succeed with its own ``__wrapped__`` chain.
+                for fn in group:
+                    views[fn] = cls.from_callable(fn, include_extras=include_extras)
+                continue
+            for fn, fn_hints in zip(group, hints):
+                views[fn] = cls(fn, fn_hints)
+        return {fn: views[fn] for fn in fns}
+
+    @classmethod
+    def from_module(
+        cls: type[Self],
+        module: types.ModuleType,
+        *,
+        include_extras: bool = False,
+    ) -> dict[Callable[..., Any], Self]:
+        """Construct views of the functions defined in a module, and of the methods of classes defined there.
+
+        Methods are introspected as the plain functions found in the class namespace, so their views include the
+        ``self`` or ``cls`` parameter. See :meth:`from_many`.
+
+        Args:
+            module: The module to introspect.
+            include_extras: Whether to preserve ``Annotated`` metadata in resolved type hints.
+
+        Returns:
+            A mapping of each function to its view.
+        """
+        fns: list[Callable[..., Any]] = []
+        for value in vars(module).values():
+            if getattr(value, "__module__", None) != module.__name__:
+                continue
+            if isinstance(value, types.FunctionType):
+                fns.append(value)
+            elif isinstance(value, type):
+                for attr in vars(value).values():
+                    fn = attr.__func__ if isinstance(attr, (classmethod, staticmethod)) else attr  # pyright: ignore
+                    if isinstance(fn, types.FunctionType):
+                        fns.append(fn)
+        return cls.from_many(fns, include_extras=include_extras)
+
+    @property
+    def binding_plan(self) -> BindingPlan:
+        """The layout of the parameters, precomputed on first access to bind arguments without the signature."""
+        try:
+            return self._binding_plan
+        except AttributeError:
+            pass
+        self._binding_plan: BindingPlan = BindingPlan(self.parameters)
+        return self._binding_plan
+
+    def bind(self, /, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        """Bind arguments to the parameters of the callable, like ``signature.bind(*args, **kwargs).arguments``.
+
+        The binding uses the precomputed :attr:`binding_plan`, skipping :meth:`inspect.Signature.bind`.
+
+        Args:
+            *args: The positional arguments.
+            **kwargs: The keyword arguments.
+
+        Returns:
+            A mapping of parameter names to bound values, in the order of the parameters.
+
+        Raises:
+            TypeError: If the arguments do not match the parameters.
+        """
+        return self.binding_plan.bind(args, kwargs)
+
+    def _index_parameters(self) -> None:
+        """Build the indexes of the parameters, so that per-call bookkeeping is a lookup rather than a scan."""
+        self.parameter_map = MappingProxyType({p.name: p for p in self.parameters})
+        """Parameters by name."""
+        self.required_names = frozenset(
+            p.name for p in self.parameters if not p.has_default and p.kind not in _VARIADIC_KINDS
+        )
+        """Names of the parameters that must be passed an argument."""
+        self.defaults = MappingProxyType({p.name: p.default for p in self.parameters if p.has_default})
+        """Default values by parameter name, for the parameters that have one."""
+        self.nullable_names = frozenset(
+            p.name for p in self.parameters if p.kind not in _VARIADIC_KINDS and _accepts_none(p.type_view)
+        )
+        """Names of the parameters that may be passed ``None``, as their annotation accepts it or they have none.
+
+        ``*args`` and ``**kwargs`` are left out, as their annotation applies to each of the arguments they collect.
+        """
+        self.annotated_parameters = MappingProxyType({p.name: p for p in self.parameters if p.type_view.metadata})
+        """Parameters by name, for the parameters whose annotation carries ``Annotated`` metadata."""
+
+    def _attach(self, fn: Callable[..., Any] | None) -> Self:
+        """Return a shallow copy of the view, introspecting ``fn``."""
+        view = self.__class__.__new__(self.__class__)
+        view.__dict__.update(self.__dict__)
+        view.callable = fn  # type: ignore[assignment]
+        return view
+
+    @staticmethod
+    def cache_info() -> CacheInfo:
+        """Report hit and miss statistics of the views cached by :meth:`from_callable`."""
+        return _VIEW_CACHE.info()
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all views cached by :meth:`from_callable` and reset the statistics."""
+        _VIEW_CACHE.clear()
+
+
+def _fingerprint(fn: Callable[..., Any], hint_fn: Any) -> _Fingerprint:
+    return (
+        getattr(hint_fn, "__annotations__", None),
+        getattr(fn, "__signature__", None),
+        getattr(fn, "__wrapped__", None),
+    )
+
+
+def _is_current(cached: _Fingerprint, current: _Fingerprint) -> bool:
+    return cached[1] is current[1] and cached[2] is current[2] and cached[0] == current[0]
+
+
+def _accepts_none(type_view: TypeView[Any]) -> bool:
+    """Whether ``None`` is a valid argument for a parameter annotated with ``type_view``."""
+    if type_view.is_optional or type_view.is_none_type:
+        return True
+    return type_view.annotation is Any or type_view.annotation is object
+
+
+def _unpickle_callable_view(
+    cls: type[CallableView],
+    fn: Callable[..., Any],
+    state: tuple[inspect.Signature, TypeView[Any], tuple[ParameterView, ...]],
+) -> CallableView:
+    view = cls.__new__(cls)
+    view.callable = fn
+    view.signature, view.return_type, view.parameters = state
+    view._index_parameters()  # pyright: ignore[reportPrivateUsage]
+    return view
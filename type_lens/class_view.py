@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import dataclasses
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Final, Iterable, cast
+
+from typing_extensions import Literal, TypeAlias, is_typeddict
+
+from type_lens.cache import BoundedCache, CacheInfo
+from type_lens.field_view import FieldView
+from type_lens.type_view import TypeView
+from type_lens.types.empty import Empty
+from type_lens.typing import get_type_hints
+
+__all__ = ("ClassKind", "ClassView")
+
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+ClassKind: TypeAlias = Literal["attrs", "dataclass", "namedtuple", "typeddict"]
+"""The kinds of classes whose fields are introspected by :class:`ClassView`."""
+
+_VIEW_CACHE: Final[BoundedCache[tuple[type, type, int, int], tuple[Any, Any, ClassView]]] = BoundedCache(maxsize=1024)
+"""Views built by :meth:`ClassView.from_class` with ``cache=True``, with the namespaces they were resolved in.
+
+Entries are keyed by class, view class and namespace ids.
+"""
+
+
+class ClassView:
+    """Represents the fields of a dataclass, ``TypedDict``, ``NamedTuple`` or attrs class."""
+
+    def __init__(self, cls: type, kind: ClassKind, fields: Iterable[FieldView]) -> None:
+        """Initialize ClassView.
+
+        Args:
+            cls: The introspected class.
+            kind: The kind of the class.
+            fields: Views of the fields of the class, in declaration order.
+        """
+        self.cls = cls
+        self.kind = kind
+        self.fields = tuple(fields)
+
+        # Indexes of the fields, so that checking a payload is a set operation rather than a scan.
+        self.field_map = MappingProxyType({f.name: f for f in self.fields})
+        """Fields by name."""
+        self.required_keys = frozenset(f.name for f in self.fields if f.is_required)
+        """Names of the fields that must be given a value."""
+        self.optional_keys = frozenset(f.name for f in self.fields if not f.is_required)
+        """Names of the fields that may be left out."""
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ClassView):
+            return False
+
+        return bool(self.cls == other.cls and self.kind == other.kind and self.fields == other.fields)
+
+    def __repr__(self) -> str:
+        cls_name = self.__class__.__name__
+
+        return f"{cls_name}({self.cls.__name__})"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # The indexes of the fields are rebuilt rather than pickled.
+        return self.__class__, (self.cls, self.kind, self.fields)
+
+    @classmethod
+    def from_class(
+        cls: type[Self],
+        model: type,
+        *,
+        globalns: dict[str, Any] | None = None,
+        localns: dict[str, Any] | None = None,
+        cache: bool = False,
+    ) -> Self:
+        """Construct a :class:`ClassView` from a class, resolving the annotations of its fields.
+
+        Annotations are resolved with ``include_extras=True``, so that ``Annotated`` metadata and the ``Required``
+        and ``NotRequired`` qualifiers of ``TypedDict`` keys are available on :attr:`FieldView.type_view`.
+
+        Fields are:
+
+        - for a ``TypedDict``, its keys. Keys are required according to their ``Required`` or ``NotRequired``
+          qualifier, or else to the totality of the class that declared them.
+        - for a dataclass, the fields that are arguments of ``__init__``, with their default value or factory.
+        - for an attrs class, the attributes that are arguments of ``__init__``, with their default value or
+          factory. Factories that take ``self`` are not exposed, but their field is not required.
+        - for a ``NamedTuple``, or a class created by ``collections.namedtuple()``, its fields and their defaults.
+
+        Args:
+            model: The class to introspect.
+            globalns: Optional global namespace for resolving forward references.
+            localns: Optional local namespace for resolving forward references.
+            cache: Whether to reuse the view built by a previous call for the same class and namespaces.
+
+        Returns:
+            A :class:`ClassView` instance.
+
+        Raises:
+            ValueError: If ``model`` is not a dataclass, ``TypedDict``, ``NamedTuple`` or attrs class.
+        """
+        if cache:
+            key = (model, cls, id(globalns), id(localns))
+            entry = _VIEW_CACHE.get(key)
+            if entry is not None:
+                # The entry references the namespaces, so that their ids in the key cannot be reused by other objects.
+                cached_globalns, cached_localns, view = entry
+                if cached_globalns is globalns and cached_localns is localns:
+                    return view  # type: ignore[return-value]
+                _VIEW_CACHE.pop(key)
+            view = cls.from_class(model, globalns=globalns, localns=localns)
+            return _VIEW_CACHE.set(key, (globalns, localns, view))[2]  # type: ignore[return-value]
+
+        if not isinstance(model, type):  # pyright: ignore[reportUnnecessaryIsInstance]
+            raise ValueError(f"{model} is not a class.")
+        kind = _class_kind(model)
+        if kind is None:
+            raise ValueError(f"{model} is not a dataclass, TypedDict, NamedTuple or attrs class.")
+        hints = get_type_hints(model, globalns=globalns, localns=localns, include_extras=True)
+        return cls(model, kind, _FIELD_READERS[kind](model, hints))
+
+    @staticmethod
+    def cache_info() -> CacheInfo:
+        """Report hit and miss statistics of the views cached by :meth:`from_class`."""
+        return _VIEW_CACHE.info()
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all views cached by :meth:`from_class` and reset the statistics."""
+        _VIEW_CACHE.clear()
+
+
+def _class_kind(model: type) -> ClassKind | None:
+    if is_typeddict(model):
+        return "typeddict"
+    if hasattr(model, "__attrs_attrs__"):
+        return "attrs"
+    if hasattr(model, "_fields") and issubclass(model, tuple):
+        return "namedtuple"
+    if dataclasses.is_dataclass(model):
+        return "dataclass"
+    return None
+
+
+def _typeddict_fields(model: type, hints: dict[str, Any]) -> list[FieldView]:
+    # ``__required_keys__`` misses the qualifiers of string annotations, so the resolved ones take precedence. It
+    # still accounts for the totality of the class that declared each key.
+    required_keys = getattr(model, "__required_keys__", None)
+    total = getattr(model, "__total__", True)
+    fields: list[FieldView] = []
+    for name, annotation in hints.items():
+        type_view = TypeView.of(annotation)
+        if type_view.is_required or type_view.is_not_required:
+            is_required = type_view.is_required
+        else:
+            is_required = name in required_keys if required_keys is not None else total
+        fields.append(FieldView(name, type_view, is_required=is_required))
+    return fields
+
+
+def _dataclass_fields(model: type, hints: dict[str, Any]) -> list[FieldView]:
+    return [
+        FieldView.from_annotation(
+            field.name,
+            hints,
+            default=_empty_if(field.default, dataclasses.MISSING),
+            default_factory=_empty_if(field.default_factory, dataclasses.MISSING),
+        )
+        for field in dataclasses.fields(model)
+        if field.init
+    ]
+
+
+def _attrs_fields(model: type, hints: dict[str, Any]) -> list[FieldView]:
+    # attrs is an optional dependency, only imported for classes that were built by attrs.
+    from attr import NOTHING, Factory, fields_dict  # noqa: PLC0415
+
+    fields: list[FieldView] = []
+    for attribute in fields_dict(model).values():
+        if not attribute.init:
+            continue
+        if attribute.name not in hints and attribute.type is not None:
+            hints = {**hints, attribute.name: attribute.type}
+
+        default: Any = attribute.default
+        # ``Factory`` is a class, that the attrs stubs declare as a function.
+        if isinstance(default, Factory):  # type: ignore[arg-type]  # pyright: ignore[reportArgumentType]
+            factory = default.factory if not default.takes_self else Empty
+            field = FieldView.from_annotation(attribute.name, hints, default_factory=factory, is_required=False)
+        else:
+            field = FieldView.from_annotation(attribute.name, hints, default=_empty_if(default, NOTHING))
+        fields.append(field)
+    return fields
+
+
+def _namedtuple_fields(model: type, hints: dict[str, Any]) -> list[FieldView]:
+    defaults = cast("dict[str, Any]", model._field_defaults)  # type: ignore[attr-defined]
+    names = cast("tuple[str, ...]", model._fields)  # type: ignore[attr-defined]
+    return [FieldView.from_annotation(name, hints, default=defaults.get(name, Empty)) for name in names]
+
+
+def _empty_if(value: Any, missing: Any) -> Any:
+    return Empty if value is missing else value
+
+
+_FIELD_READERS: Final[dict[ClassKind, Callable[[type, dict[str, Any]], list[FieldView]]]] = {
+    "attrs": _attrs_fields,
+    "dataclass": _dataclass_fields,
+    "namedtuple": _namedtuple_fields,
+    "typeddict": _typeddict_fields,
+}
+"""Readers of the fields of each kind of class, from the class and its resolved type hints."""
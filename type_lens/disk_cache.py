@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import hashlib
+import pickle
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Final, Iterable, Tuple
+
+from type_lens.callable_view import CallableView
+
+if TYPE_CHECKING:
+    import os
+
+__all__ = ("DiskCache",)
+
+_Key = Tuple[str, str, bool]
+
+_FORMAT: Final = (2, sys.version_info[:2])
+"""Version of the cache files, and of the Python that pickled them."""
+
+
+class _ModuleEntries:
+    __slots__ = ("dirty", "source_hash", "views")
+
+    def __init__(self, source_hash: str) -> None:
+        self.source_hash = source_hash
+        """Hash of the source file that the views were introspected from."""
+        self.views: dict[_Key, CallableView] = {}
+        """Views detached from their callable, keyed by qualified name, type of callable and ``include_extras``."""
+        self.dirty = False
+        """Whether views were added since the file was read."""
+
+
+class DiskCache:
+    """A persistent cache of :class:`CallableView` introspection, to speed up the cold start of a process.
+
+    Views are stored in one file per module, along with a hash of the module's source file. The file is read once,
+    on the first lookup of a callable of the module, and its entries are dropped if the source file changed since
+    they were stored. Views are stored with their resolved parameters and annotations, and are rehydrated by
+    unpickling, without resolving type hints again.
+
+    Only the source file of a callable is tracked: a change of an annotation imported from another module, e.g.
+    the value of a type alias, is not detected. Call :meth:`clear` after such a change.
+
+    Warning:
+        Cache files are read with :mod:`pickle`. Only use a directory that is not writable by untrusted users.
+    """
+
+    __slots__ = {
+        "directory": "The directory of the cache files.",
+        "_modules": "The entries of each module read so far, keyed by module name.",
+        "_lock": "Lock serializing reads and writes of the entries.",
+    }
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        """Initialize DiskCache.
+
+        Args:
+            directory: The directory of the cache files, created on the first write.
+        """
+        self.directory: Final = Path(directory)
+        self._modules: dict[str, _ModuleEntries | None] = {}
+        self._lock = threading.RLock()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({str(self.directory)!r})"
+
+    def from_callable(self, fn: Callable[..., Any], *, include_extras: bool = False) -> CallableView:
+        """Construct a :class:`CallableView`, reusing the introspection stored by a previous process.
+
+        Callables that cannot be located by module and qualified name, e.g. lambdas, functions defined in a function
+        or callable instances, are introspected with :meth:`CallableView.from_callable` and not stored.
+
+        Args:
+            fn: The callable to introspect.
+            include_extras: Whether to preserve ``Annotated`` metadata in resolved type hints.
+
+        Returns:
+            A :class:`CallableView` instance.
+        """
+        return self.from_many([fn], include_extras=include_extras)[fn]
+
+    def from_many(
+        self,
+        fns: Iterable[Callable[..., Any]],
+        *,
+        include_extras: bool = False,
+    ) -> dict[Callable[..., Any], CallableView]:
+        """Construct views of many callables at once, reusing the introspection stored by a previous process.
+
+        Callables missing from the cache are introspected with :meth:`CallableView.from_many`, and stored with a
+        single write per module.
+
+        Args:
+            fns: The callables to introspect.
+            include_extras: Whether to preserve ``Annotated`` metadata in resolved type hints.
+
+        Returns:
+            A mapping of each callable to its view, in the order of ``fns``.
+        """
+        fns = list(fns)
+        views: dict[Callable[..., Any], CallableView] = {}
+        missing: dict[Callable[..., Any], tuple[_ModuleEntries, _Key] | None] = {}
+        with self._lock:
+            for fn in fns:
+                location = _locate(fn)
+                module = self._module(*location[:2]) if location is not None else None
+                if location is None or module is None:
+                    missing[fn] = None
+                    continue
+                # A function and the methods bound from it share a qualified name, but not a signature.
+                key = (location[2], type(fn).__qualname__, include_extras)
+                view = module.views.get(key)
+                if view is None:
+                    missing[fn] = (module, key)
+                else:
+                    views[fn] = view._attach(fn)  # pyright: ignore[reportPrivateUsage]
+
+            if missing:
+                introspected = CallableView.from_many(missing, include_extras=include_extras)
+                for fn, entry in missing.items():
+                    views[fn] = introspected[fn]
+                    if entry is not None:
+                        _store(*entry, introspected[fn])
+                self._save()
+        return {fn: views[fn] for fn in fns}
+
+    def clear(self) -> None:
+        """Remove all cache files, and drop the entries read so far."""
+        with self._lock:
+            self._modules.clear()
+            if self.directory.is_dir():
+                for path in self.directory.glob("*.pickle"):
+                    path.unlink()
+
+    def _module(self, name: str, source: str) -> _ModuleEntries | None:
+        """Read the entries of a module, dropping them if its source file changed."""
+        try:
+            return self._modules[name]
+        except KeyError:
+            pass
+        try:
+            source_hash = hashlib.sha256(Path(source).read_bytes()).hexdigest()
+        except OSError:  # e.g. a module loaded from a zip archive
+            module = None
+        else:
+            module = _ModuleEntries(source_hash)
+            try:
+                data = pickle.loads(self._path(name).read_bytes())  # noqa: S301
+                if data["format"] == _FORMAT and data["source_hash"] == source_hash:
+                    module.views = data["views"]
+            except Exception:  # noqa: BLE001, S110
+                # A missing, outdated or corrupt file is the same as an empty one, e.g. if an annotation refers to a
+                # class that was since removed from another module.
+                pass
+        self._modules[name] = module
+        return module
+
+    def _save(self) -> None:
+        """Write the entries of the modules that changed, replacing their file atomically."""
+        for name, module in self._modules.items():
+            if module is None or not module.dirty:
+                continue
+            # Views of a module are pickled together, so that the annotations they share are pickled once.
+            data = {"format": _FORMAT, "source_hash": module.source_hash, "views": module.views}
+            try:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                with tempfile.NamedTemporaryFile(dir=self.directory, suffix=".tmp", delete=False) as file:
+                    pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+                Path(file.name).replace(self._path(name))
+            except OSError:
+                # The cache is an optimization: a read-only or full disk must not fail introspection.
+                continue
+            module.dirty = False
+
+    def _path(self, name: str) -> Path:
+        return self.directory / f"{name}.pickle"
+
+
+def _locate(fn: Callable[..., Any]) -> tuple[str, str, str] | None:
+    """Return the module name, source file and qualified name of a callable that can be found again by name."""
+    qualname = getattr(fn, "__qualname__", None)
+    module = sys.modules.get(getattr(fn, "__module__", None) or "")
+    source = getattr(module, "__file__", None)
+    if not isinstance(qualname, str) or "<" in qualname or source is None:
+        return None
+    return module.__name__, source, qualname  # type: ignore[union-attr]
+
+
+def _store(module: _ModuleEntries, key: _Key, view: CallableView) -> None:
+    detached = view._attach(None)  # pyright: ignore[reportPrivateUsage]
+    try:
+        pickle.dumps(detached, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:  # noqa: BLE001
+        # e.g. a default value or an annotation that cannot be pickled.
+        return
+    module.views[key] = detached
+    module.dirty = True
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Final
+
+from type_lens.type_view import TypeView
+from type_lens.types.empty import Empty, EmptyType
+
+__all__ = ("FieldView",)
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+_any_type_view = TypeView.of(Any)
+
+
+class FieldView:
+    """Represents a field of a class, such as a dataclass, ``TypedDict``, ``NamedTuple`` or attrs class."""
+
+    __slots__ = {
+        "name": "The name of the field.",
+        "type_view": "View of the field's annotation type.",
+        "default": "The default value of the field.",
+        "default_factory": "The callable that produces the default value of the field.",
+        "is_required": "Whether a value must be given for the field.",
+        "has_annotation": (
+            "Whether the field had an annotation or not. Lack of an annotation implies "
+            "`TypeView(Any)`, but that is distinct from being explicitly `Any` annotated."
+        ),
+    }
+
+    def __init__(
+        self,
+        name: str,
+        type_view: TypeView[Any] = _any_type_view,
+        *,
+        default: Any | EmptyType = Empty,
+        default_factory: Callable[[], Any] | EmptyType = Empty,
+        is_required: bool | None = None,
+        has_annotation: bool = True,
+    ) -> None:
+        """Initialize FieldView.
+
+        Args:
+            name: The field name.
+            type_view: View of the field's type annotation.
+            default: The field's default value, or :data:`Empty` if no default.
+            default_factory: The callable that produces the field's default value, or :data:`Empty` if none.
+            is_required: Whether a value must be given for the field. Defaults to whether the field has neither a
+                default value nor a default factory.
+            has_annotation: Whether the field had an explicit annotation. Lack of an annotation implies
+                ``TypeView(Any)``, but that is distinct from an explicit ``Any`` annotation.
+        """
+        self.name: Final = name
+        self.type_view: Final = type_view
+        self.default: Final = default
+        self.default_factory: Final = default_factory
+        if is_required is None:
+            is_required = default is Empty and default_factory is Empty
+        self.is_required: Final = is_required
+        self.has_annotation: Final = has_annotation
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FieldView):
+            return False
+
+        return bool(
+            self.name == other.name
+            and self.type_view == other.type_view
+            and self.default == other.default
+            and self.default_factory == other.default_factory
+            and self.is_required == other.is_required
+            and self.has_annotation == other.has_annotation
+        )
+
+    def __repr__(self) -> str:
+        cls_name = self.__class__.__name__
+
+        args = [
+            repr(self.name),
+            repr(self.type_view) if self.type_view else None,
+            f"default={self.default}" if self.default is not Empty else None,
+            f"default_factory={self.default_factory}" if self.default_factory is not Empty else None,
+            f"is_required={self.is_required}" if self.is_required is self.has_default else None,
+        ]
+        args_str = ", ".join(a for a in args if a is not None)
+        return f"{cls_name}({args_str})"
+
+    @property
+    def has_default(self) -> bool:
+        """Whether the field has a default value, or a default factory."""
+        return self.default is not Empty or self.default_factory is not Empty
+
+    @classmethod
+    def from_annotation(cls, name: str, type_hints: dict[str, Any], **kwargs: Any) -> Self:
+        """Initialize FieldView from the resolved type hints of a class.
+
+        Args:
+            name: The field name.
+            type_hints: Mapping of names to types. Should be the result of ``get_type_hints()``.
+            **kwargs: The remaining arguments of :class:`FieldView`.
+
+        Returns:
+            FieldView.
+        """
+        has_annotation = name in type_hints
+        return cls(
+            name,
+            TypeView.of(type_hints[name]) if has_annotation else _any_type_view,
+            has_annotation=has_annotation,
+            **kwargs,
+        )
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import typing
+from types import MappingProxyType
+from typing import Any, Final, Generic, Mapping
+
+import typing_extensions
+from typing_extensions import get_args, get_origin
+
+from type_lens.cache import BoundedCache, CacheInfo
+from type_lens.type_view import TypeView
+
+__all__ = ("clear_generic_bases_cache", "generic_bases_cache_info", "get_generic_bases")
+
+
+_MARKERS: Final = frozenset((Generic, typing.Protocol, typing_extensions.Protocol))
+"""Bases that only mark a class as generic, and are left out of the resolved bases."""
+
+_GENERIC_BASES_CACHE: Final[BoundedCache[type, Mapping[type, TypeView[Any]]]] = BoundedCache(maxsize=1024)
+"""Results of :func:`get_generic_bases`, keyed by class."""
+
+
+def get_generic_bases(cls: type) -> Mapping[type, TypeView[Any]]:
+    """Resolve the bases of a class, as views of their parametrization seen from the class.
+
+    ``__orig_bases__`` are walked up the MRO, substituting the type variables of each generic base with the args
+    given by its subclass. The result is cached per class, so that finding the concrete args of a base is a single
+    lookup.
+
+    Examples:
+        >>> from typing import Generic, TypeVar
+        >>> from type_lens.generics import get_generic_bases
+        >>> T = TypeVar("T")
+        >>> class Repo(Generic[T]): ...
+        >>> class UserRepo(Repo[int]): ...
+        >>> get_generic_bases(UserRepo)[Repo]
+        TypeView(Repo[int])
+
+    Args:
+        cls: The class to resolve the bases of.
+
+    Returns:
+        A read-only mapping of each class of the MRO of ``cls``, in MRO order, to a view of its parametrization.
+        ``cls`` maps to itself, subscripted with its own type variables if it is generic. ``Generic`` and
+        ``Protocol`` are left out.
+    """
+    bases = _GENERIC_BASES_CACHE.get(cls)
+    if bases is None:
+        bases = _GENERIC_BASES_CACHE.set(cls, _resolve_generic_bases(cls))
+    return bases
+
+
+def clear_generic_bases_cache() -> None:
+    """Drop all results cached by :func:`get_generic_bases`."""
+    _GENERIC_BASES_CACHE.clear()
+
+
+def generic_bases_cache_info() -> CacheInfo:
+    """Report hit and miss statistics of :func:`get_generic_bases`."""
+    return _GENERIC_BASES_CACHE.info()
+
+
+def _resolve_generic_bases(cls: type) -> Mapping[type, TypeView[Any]]:
+    parameters = getattr(cls, "__parameters__", ())
+    bases: dict[type, TypeView[Any]] = {cls: TypeView.of(cls[parameters] if parameters else cls)}  # type: ignore[index]
+
+    for base in cls.__dict__.get("__orig_bases__", cls.__bases__):
+        origin = get_origin(base) or base
+        if not isinstance(origin, type) or origin in _MARKERS:
+            continue
+        mapping = dict(zip(getattr(origin, "__parameters__", ()), get_args(base)))
+        for base_cls, view in get_generic_bases(origin).items():
+            if base_cls is origin:
+                view = TypeView.of(base)
+            elif mapping:
+                view = view.substitute(mapping)
+            bases.setdefault(base_cls, view)
+
+    return MappingProxyType(
+        {base_cls: bases.get(base_cls) or TypeView.of(base_cls) for base_cls in cls.__mro__ if base_cls not in _MARKERS}
+    )
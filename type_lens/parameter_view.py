@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from inspect import Signature
+from inspect import Parameter, Signature
 from typing import TYPE_CHECKING, Any, Final
 
 from type_lens.type_view import TypeView
@@ -9,11 +9,11 @@ from type_lens.types.empty import Empty, EmptyType
 __all__ = ("ParameterView",)
 
 if TYPE_CHECKING:
-    from inspect import Parameter
+    from inspect import _ParameterKind  # pyright: ignore[reportPrivateUsage]
 
     from typing_extensions import Self
 
-_any_type_view = TypeView(Any)
+_any_type_view = TypeView.of(Any)
 
 
 class ParameterView:
@@ -22,6 +22,7 @@ class ParameterView:
     __slots__ = {
         "name": "The name of the parameter.",
         "default": "The default value of the parameter.",
+        "kind": "How arguments bind to the parameter, e.g. ``Parameter.KEYWORD_ONLY``.",
         "type_view": "View of the parameter's annotation type.",
         "has_annotation": (
             "Whether the parameter had an annotation or not. Lack of an annotation implies "
@@ -36,6 +37,7 @@ class ParameterView:
         *,
         default: Any | EmptyType = Empty,
         has_annotation: bool = True,
+        kind: _ParameterKind = Parameter.POSITIONAL_OR_KEYWORD,
     ) -> None:
         """Initialize ParameterView.
 
@@ -46,11 +48,13 @@ class ParameterView:
             has_annotation: Whether the parameter had an explicit annotation. Lack of an
                 annotation implies ``TypeView(Any)``, but that is distinct from an explicit
                 ``Any`` annotation.
+            kind: How arguments bind to the parameter, as in :attr:`inspect.Parameter.kind`.
         """
         self.name: Final = name
         self.type_view: Final = type_view
         self.default: Final = default
         self.has_annotation: Final = has_annotation
+        self.kind: Final = kind
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, ParameterView):
@@ -61,6 +65,7 @@ class ParameterView:
             and self.type_view == other.type_view
             and self.default == other.default
             and self.has_annotation == other.has_annotation
+            and self.kind == other.kind
         )
 
     def __repr__(self) -> str:
@@ -70,6 +75,7 @@ class ParameterView:
             repr(self.name),
             repr(self.type_view) if self.type_view else None,
             f"default={self.default}" if self.default is not Empty else None,
+            f"kind={self.kind!s}" if self.kind is not Parameter.POSITIONAL_OR_KEYWORD else None,
         ]
         args_str = ", ".join(a for a in args if a is not None)
         return f"{cls_name}({args_str})"
@@ -96,5 +102,6 @@ class ParameterView:
             name=parameter.name,
             default=Empty if parameter.default is Signature.empty else parameter.default,
             has_annotation=parameter.annotation is not Signature.empty,
-            type_view=TypeView(annotation),
+            type_view=TypeView.of(annotation),
+            kind=parameter.kind,
         )
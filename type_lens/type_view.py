@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import importlib
 import sys
+import types
 import typing
 from collections import abc
 from collections.abc import Collection, Mapping
+from enum import IntFlag
 from typing import (
+    TYPE_CHECKING,
     Any,
     AnyStr,
     Final,
@@ -21,13 +25,91 @@ import typing_extensions
 from typing_extensions import Annotated, NotRequired, Required, get_args, get_origin
 from typing_extensions import Literal as ExtensionsLiteral
 
+from type_lens.cache import BoundedCache
+from type_lens.exc import TypeViewError
 from type_lens.types.builtins import UNION_TYPES, NoneType
+from type_lens.typing import evaluate_forward_ref
 from type_lens.utils import INSTANTIABLE_TYPE_MAPPING, SAFE_GENERIC_ORIGIN_MAP, unwrap_annotation
+from type_lens.validation import UnionDispatcher, Validator, compile_validator
 
-__all__ = ("TypeView",)
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+__all__ = ("TypeView", "TypeViewFlag")
 
 
 T = TypeVar("T")
+_T = TypeVar("_T")
+
+_GenericAlias: Final[Any] = getattr(types, "GenericAlias", None)
+"""The type of builtin generics such as ``list[int]``, on Python 3.9+."""
+
+
+class TypeViewFlag(IntFlag):
+    """Bits of :attr:`TypeView.flags`, one per boolean ``is_*`` predicate of a view.
+
+    Examples:
+        >>> from typing import Optional
+        >>> from type_lens import TypeView, TypeViewFlag
+        >>> TypeViewFlag(TypeView(Optional[int]).flags)
+        <TypeViewFlag.OPTIONAL|UNION: 8448>
+    """
+
+    ANNOTATED = 1 << 0
+    COLLECTION = 1 << 1
+    FORWARD_REF = 1 << 2
+    LITERAL = 1 << 3
+    MAPPING = 1 << 4
+    NON_STRING_COLLECTION = 1 << 5
+    NONE_TYPE = 1 << 6
+    NOT_REQUIRED = 1 << 7
+    OPTIONAL = 1 << 8
+    REQUIRED = 1 << 9
+    TUPLE = 1 << 10
+    TYPE_ALIAS = 1 << 11
+    TYPE_VAR = 1 << 12
+    UNION = 1 << 13
+    VARIADIC_TUPLE = 1 << 14
+
+
+# Plain ``int`` copies of the flags: bitwise operations on ``IntFlag`` members are an order of magnitude slower.
+_ANNOTATED: Final = TypeViewFlag.ANNOTATED.value
+_COLLECTION: Final = TypeViewFlag.COLLECTION.value
+_FORWARD_REF: Final = TypeViewFlag.FORWARD_REF.value
+_LITERAL: Final = TypeViewFlag.LITERAL.value
+_MAPPING: Final = TypeViewFlag.MAPPING.value
+_NON_STRING_COLLECTION: Final = TypeViewFlag.NON_STRING_COLLECTION.value
+_NONE_TYPE: Final = TypeViewFlag.NONE_TYPE.value
+_NOT_REQUIRED: Final = TypeViewFlag.NOT_REQUIRED.value
+_OPTIONAL: Final = TypeViewFlag.OPTIONAL.value
+_REQUIRED: Final = TypeViewFlag.REQUIRED.value
+_TUPLE: Final = TypeViewFlag.TUPLE.value
+_TYPE_ALIAS: Final = TypeViewFlag.TYPE_ALIAS.value
+_TYPE_VAR: Final = TypeViewFlag.TYPE_VAR.value
+_UNION: Final = TypeViewFlag.UNION.value
+_VARIADIC_TUPLE: Final = TypeViewFlag.VARIADIC_TUPLE.value
+
+_INTERN_CACHE: Final[BoundedCache[tuple[Any, ...], TypeView[Any]]] = BoundedCache(maxsize=4096)
+"""Shared views handed out by :meth:`TypeView.of`, keyed by view class, annotation and metadata."""
+
+_IDENTITY_CACHE: Final[BoundedCache[tuple[Any, int], tuple[Any, TypeView[Any]]]] = BoundedCache(maxsize=4096)
+"""Views of :data:`_INTERN_CACHE` keyed by view class and annotation identity, along with the annotation.
+
+``typing`` caches the aliases it builds, so the same annotation object is often looked up again. Its view is then
+found without hashing the whole annotation.
+"""
+
+_SUBTYPE_CACHE: Final[BoundedCache[tuple[TypeView[Any], Any], bool]] = BoundedCache(maxsize=4096)
+"""Memoized results of :meth:`TypeView.is_subtype_of`, keyed by view and target type(s)."""
+
+_ALIAS_VALUE_CACHE: Final[BoundedCache[Any, tuple[Any]]] = BoundedCache(maxsize=1024)
+"""Values of type aliases, keyed by alias, as evaluating ``__value__`` can be costly."""
+
+_ALIAS_GRAPH_CACHE: Final[BoundedCache[tuple[Any, ...], TypeView[Any]]] = BoundedCache(maxsize=1024)
+"""Views of deeply expanded type aliases, keyed by alias and metadata, so that their cyclic graphs are shared."""
+
+_SUBCLASS_CACHE: Final[BoundedCache[tuple[type, Any], bool]] = BoundedCache(maxsize=4096)
+"""Memoized results of :meth:`TypeView.is_subclass_of`, keyed by the view's ``fallback_origin`` and target type(s)."""
 
 
 class TypeView(Generic[T]):
@@ -36,15 +118,34 @@ class TypeView(Generic[T]):
     __slots__ = {
         "annotation": "The annotation with any 'wrapper' types removed, e.g. Annotated.",
         "args": "The result of calling get_args(annotation) after unwrapping Annotated, e.g. (int,).",
-        "inner_types": "The type's generic args parsed as ParsedType, if applicable.",
         "metadata": "Any metadata associated with the annotation via Annotated.",
         "origin": "The result of calling get_origin(annotation) after unwrapping Annotated, e.g. list.",
         "fallback_origin": "The unsubscripted version of a type, distinct from 'origin' in that for non-generics, this is the original type.",
         "raw": "The annotation exactly as received.",
-        "_wrappers": "A set of wrapper types that were removed from the annotation.",
+        "_wrappers": "A frozenset of wrapper types that were removed from the annotation.",
+        "_inner_types": "Views of the generic args, built on first access of ``inner_types``.",
+        "flags": "Bitwise OR of the TypeViewFlag members that apply to the view, computed once at construction.",
+        "_hash": "The structural hash of the view, consistent with its equality.",
+        "_globalns": "Global namespace captured to resolve forward references.",
+        "_localns": "Local namespace captured to resolve forward references.",
+        "_resolved": "View of the resolved forward reference, set on first call of ``resolve()``.",
+        "_validator": "Validator of the annotation, compiled on first call of ``compile_validator()``.",
+        "_dispatcher": "Dispatch index of the union members, built on first call of ``union_dispatcher()``.",
+        "_literal_index": "Flattened ``Literal`` values, as values, (type, value) pairs and unhashable values.",
+        "_non_optional": "View of an optional union without ``None``, set on first call of ``strip_optional()``.",
+        "_stripped": "View of the value of a type alias, set on first call of ``strip_type_alias()``.",
+        "_expanded": "View with all type aliases expanded, set on first call of ``strip_type_alias(deep=True)``.",
+        "_alias_of": "The type alias that the view is the expansion of, in a graph of expanded type aliases.",
     }
 
-    def __init__(self, annotation: T, *, metadata: Sequence[Any] = ()) -> None:
+    def __init__(
+        self,
+        annotation: T,
+        *,
+        metadata: Sequence[Any] = (),
+        globalns: dict[str, Any] | None = None,
+        localns: dict[str, Any] | None = None,
+    ) -> None:
         """Initialize TypeView.
 
         Args:
@@ -52,6 +153,10 @@ class TypeView(Generic[T]):
                 ``get_type_hints(..., include_extras=True)`` so that forward references are resolved and recursive
                 ``Annotated`` types are flattened.
             metadata: Additional metadata to associate with the annotation.
+            globalns: Global namespace in which :meth:`resolve` evaluates forward references of the annotation and
+                its inner types.
+            localns: Local namespace in which :meth:`resolve` evaluates forward references of the annotation and
+                its inner types.
         """
         unwrapped, annotation_metadata, wrappers = unwrap_annotation(annotation)
         origin = get_origin(unwrapped)
@@ -65,9 +170,69 @@ class TypeView(Generic[T]):
         self.args: Final[tuple[Any, ...]] = args
         self.metadata: Final = (*annotation_metadata, *metadata)
         self._wrappers: Final = wrappers
-        self.inner_types: Final = tuple(TypeView(arg, metadata=self.metadata) for arg in args)
+        self._globalns: Final = globalns
+        self._localns: Final = localns
+        self._hash: Final = _structural_hash(unwrapped, origin, args)
+        self.flags: Final = self._compute_flags()
+        self._alias_of: Any = None
+
+    @classmethod
+    def of(cls: type[TypeView[Any]], annotation: _T, *, metadata: Sequence[Any] = ()) -> TypeView[_T]:
+        """Return a shared, interned view of ``annotation``.
+
+        Views are immutable, so annotations that compare equal, with equal metadata, can share a single instance and
+        its tree of ``inner_types``. Annotations or metadata that are not hashable bypass the cache and produce a new
+        view. The cache is bounded, and drops the views it interned first when full.
+
+        ``typing`` considers unions and ``Literal`` types equal regardless of the order of their members, and
+        ``Annotated`` metadata equal regardless of its type, but ``Union[int, str]`` and ``Union[str, int]``, or
+        ``Annotated[int, 1]`` and ``Annotated[int, True]``, get distinct views, so that ``args``, ``metadata`` and
+        ``raw`` reflect the annotation as written.
+
+        Args:
+            annotation: The type annotation.
+            metadata: Additional metadata to associate with the annotation.
+
+        Returns:
+            A view of the annotation, shared with previous calls for an equal annotation and metadata.
+        """
+        if not metadata:
+            # The entry references the annotation, so that its id in the key cannot be reused by another object.
+            entry = _IDENTITY_CACHE.get((cls, id(annotation)))
+            if entry is not None and entry[0] is annotation:
+                return entry[1]
+
+        metadata = tuple(metadata)
+        # Types are part of the key as values such as ``1`` and ``True`` compare equal, e.g. as ``Literal`` args.
+        key = (cls, type(annotation), annotation, _args_key(annotation), metadata, tuple(map(type, metadata)))
+        try:
+            view = _INTERN_CACHE.get(key)
+        except TypeError:  # unhashable annotation or metadata
+            return cls(annotation, metadata=metadata)
+        if view is None:
+            view = _INTERN_CACHE.set(key, cls(annotation, metadata=metadata))
+        if not metadata:
+            _IDENTITY_CACHE.set((cls, id(annotation)), (annotation, view))
+        return view
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Clear the caches shared by all views.
+
+        These are the table of interned views used by :meth:`of`, the type aliases evaluated and expanded by
+        :meth:`strip_type_alias`, and the memoized results of :meth:`is_subtype_of` and :meth:`is_subclass_of`. The
+        latter should be cleared if a class is registered as a virtual subclass of an ABC after it was checked.
+        """
+        _INTERN_CACHE.clear()
+        _IDENTITY_CACHE.clear()
+        _SUBTYPE_CACHE.clear()
+        _SUBCLASS_CACHE.clear()
+        _ALIAS_VALUE_CACHE.clear()
+        _ALIAS_GRAPH_CACHE.clear()
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, TypeView):
             return False
 
@@ -78,6 +243,63 @@ class TypeView(Generic[T]):
 
         return bool(self.annotation == other.annotation)
 
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Views are pickled by their annotation, and unpickled through the intern table of ``of``, so that memoized
+        # results are neither shipped nor duplicated. Captured namespaces are pickled along, by module name for the
+        # globals of a module.
+        metadata = self.metadata[len(unwrap_annotation(self.raw)[1]) :]
+        if self._globalns is None and self._localns is None:
+            return _unpickle_type_view, (self.__class__, self.raw, metadata)
+        namespaces = (_pickled_namespace(self._globalns), _pickled_namespace(self._localns))
+        return _unpickle_type_view, (self.__class__, self.raw, metadata, *namespaces)
+
+    def __copy__(self) -> Self:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Self:
+        return self
+
+    def _compute_flags(self) -> int:  # noqa: C901
+        annotation, origin, args, wrappers = self.annotation, self.origin, self.args, self._wrappers
+        flags = 0
+        if Annotated in wrappers:
+            flags |= _ANNOTATED
+        if Required in wrappers:
+            flags |= _REQUIRED
+        if NotRequired in wrappers:
+            flags |= _NOT_REQUIRED
+        if isinstance(annotation, (str, ForwardRef)):
+            flags |= _FORWARD_REF
+        if isinstance(annotation, TypeVar):
+            flags |= _TYPE_VAR
+        if annotation is None or annotation is NoneType:
+            flags |= _NONE_TYPE
+        if origin is Literal or origin is ExtensionsLiteral:
+            flags |= _LITERAL
+        if _is_type_alias(annotation):
+            flags |= _TYPE_ALIAS
+
+        if origin in UNION_TYPES:
+            flags |= _UNION
+            if NoneType in args:
+                flags |= _OPTIONAL
+            flags |= _union_collection_flags(args)
+        elif annotation is AnyStr:
+            flags |= _COLLECTION
+
+        fallback_origin = self.fallback_origin
+        if isinstance(fallback_origin, type):
+            if annotation is not Any and not flags & _TYPE_VAR:
+                flags |= _class_collection_flags(fallback_origin)
+            if issubclass(fallback_origin, tuple):
+                flags |= _TUPLE
+                if len(args) == 2 and args[1] is Ellipsis:
+                    flags |= _VARIADIC_TUPLE
+        return flags
+
     def __repr__(self) -> str:
         cls_name = self.__class__.__name__
         return f"{cls_name}({self.repr_type})"
@@ -104,15 +326,38 @@ class TypeView(Generic[T]):
             name = repr(self.annotation)
 
         if self.origin:
-            inner_types = ", ".join(t.repr_type for t in self.inner_types)
+            # Expanded type aliases are referred to by name, as they may recurse into themselves.
+            inner_types = ", ".join(
+                t.repr_type if t._alias_of is None else t._alias_of.__name__ for t in self.inner_types
+            )
             name = f"{name}[{inner_types}]"
 
         return name
 
+    @property
+    def inner_types(self) -> tuple[TypeView[Any], ...]:
+        """The type's generic args parsed as :class:`TypeView`, if applicable.
+
+        The views are built the first time this is accessed, so that callers that never walk the tree of a deeply
+        nested annotation do not pay for it.
+        """
+        try:
+            return self._inner_types
+        except AttributeError:
+            if self._globalns is None and self._localns is None:
+                inner_types = tuple(TypeView.of(arg, metadata=self.metadata) for arg in self.args)
+            else:
+                inner_types = tuple(
+                    TypeView(arg, metadata=self.metadata, globalns=self._globalns, localns=self._localns)
+                    for arg in self.args
+                )
+            self._inner_types: tuple[TypeView[Any], ...] = inner_types
+            return inner_types
+
     @property
     def allows_none(self) -> bool:
         """Whether the annotation supports being assigned ``None``."""
-        return self.is_optional or self.is_none_type
+        return bool(self.flags & (_OPTIONAL | _NONE_TYPE))
 
     @property
     def instantiable_origin(self) -> Any:
@@ -135,67 +380,67 @@ class TypeView(Generic[T]):
 
         This would indicate that the annotation has metadata associated with it.
         """
-        return Annotated in self._wrappers
+        return bool(self.flags & _ANNOTATED)
 
     @property
     def is_collection(self) -> bool:
         """Whether the annotation is a collection type or not."""
-        return self.is_subtype_of(Collection)
+        return bool(self.flags & _COLLECTION)
 
     @property
     def is_forward_ref(self) -> bool:
         """Whether the annotation is a forward reference or not."""
-        return isinstance(self.annotation, (str, ForwardRef))
+        return bool(self.flags & _FORWARD_REF)
 
     @property
     def is_literal(self) -> bool:
         """Whether the annotation is a literal value or not."""
-        return self.origin in {Literal, ExtensionsLiteral}
+        return bool(self.flags & _LITERAL)
 
     @property
     def is_mapping(self) -> bool:
         """Whether the annotation is a mapping or not."""
-        return self.is_subtype_of(Mapping)
+        return bool(self.flags & _MAPPING)
 
     @property
     def is_non_string_collection(self) -> bool:
         """Whether the annotation is a non-string collection type or not."""
-        return self.is_collection and not self.is_subtype_of((str, bytes))
+        return bool(self.flags & _NON_STRING_COLLECTION)
 
     @property
     def is_none_type(self) -> bool:
         """Whether the annotation is NoneType or not."""
-        return self.annotation in {None, NoneType}
+        return bool(self.flags & _NONE_TYPE)
 
     @property
     def is_not_required(self) -> bool:
         """Whether the annotation was wrapped in NotRequired or not."""
-        return NotRequired in self._wrappers
+        return bool(self.flags & _NOT_REQUIRED)
 
     @property
     def is_optional(self) -> bool:
         """Whether the annotation is Optional or not."""
-        return bool(self.is_union and NoneType in self.args)
+        return bool(self.flags & _OPTIONAL)
 
     @property
     def is_required(self) -> bool:
         """Whether the annotation was wrapped in Required or not."""
-        return Required in self._wrappers
+        return bool(self.flags & _REQUIRED)
 
     @property
     def is_tuple(self) -> bool:
         """Whether the annotation is a ``tuple`` or not."""
-        return self.is_subclass_of(tuple)
+        return bool(self.flags & _TUPLE)
 
     @property
     def is_type_var(self) -> bool:
         """Whether the annotation is a TypeVar or not."""
-        return isinstance(self.annotation, TypeVar)
+        return bool(self.flags & _TYPE_VAR)
 
     @property
     def is_union(self) -> bool:
         """Whether the annotation is a union type or not."""
-        return self.origin in UNION_TYPES
+        return bool(self.flags & _UNION)
 
     @property
     def is_variadic_tuple(self) -> bool:
@@ -204,20 +449,12 @@ class TypeView(Generic[T]):
         Tuples like `tuple[int, ...]` represent a list-like unbounded sequence
         of a single type T.
         """
-        return self.is_tuple and len(self.args) == 2 and self.args[1] == ...  # pyright: ignore
+        return bool(self.flags & _VARIADIC_TUPLE)
 
-    if sys.version_info < (3, 12):
-
-        @property
-        def is_type_alias(self) -> bool:
-            """Whether the annotation is a new-style `type Type = ...` alias or not."""
-            return _is_typing_extensins_type_alias(self)
-    else:
-
-        @property
-        def is_type_alias(self) -> bool:
-            """Whether the annotation is a new-style `type Type = ...` alias or not."""
-            return isinstance(self.annotation, typing.TypeAliasType) or _is_typing_extensins_type_alias(self)
+    @property
+    def is_type_alias(self) -> bool:
+        """Whether the annotation is a new-style `type Type = ...` alias or not."""
+        return bool(self.flags & _TYPE_ALIAS)
 
     @property
     def safe_generic_origin(self) -> Any:
@@ -230,6 +467,68 @@ class TypeView(Generic[T]):
         """
         return SAFE_GENERIC_ORIGIN_MAP.get(self.fallback_origin)
 
+    @property
+    def literal_values(self) -> frozenset[Any]:
+        """The values of a ``Literal``, or of a union of ``Literal`` types and ``None``, flattened into a set.
+
+        The set is built on first access. Unhashable values are left out, and membership follows equality, so that
+        ``True in TypeView(Literal[1]).literal_values``: use :meth:`has_literal_value` for a check by type and
+        value.
+
+        Examples:
+            >>> from typing import Literal, Optional, Union
+            >>> from type_lens import TypeView
+            >>> sorted(TypeView(Union[Literal["a"], Literal["b", "c"]]).literal_values)
+            ['a', 'b', 'c']
+            >>> TypeView(Optional[Literal[1]]).literal_values == {1, None}
+            True
+
+        Returns:
+            The values of the literal, or an empty set if the annotation is not made of ``Literal`` types.
+        """
+        return self._get_literal_index()[0]
+
+    def has_literal_value(self, value: Any) -> bool:
+        """Whether ``value`` is one of the :attr:`literal_values`, by type as well as by value.
+
+        Hashable values are checked in constant time, against an index built on the first call.
+
+        Args:
+            value: The value to check.
+
+        Returns:
+            Whether ``value`` is one of the values of the literal.
+        """
+        _, pairs, unhashable = self._get_literal_index()
+        try:
+            if (type(value), value) in pairs:
+                return True
+        except TypeError:  # unhashable value
+            pass
+        return any(type(value) is type(v) and value == v for v in unhashable)
+
+    def _get_literal_index(self) -> tuple[frozenset[Any], frozenset[tuple[type, Any]], tuple[Any, ...]]:
+        try:
+            return self._literal_index
+        except AttributeError:
+            pass
+
+        hashable: list[object] = []
+        unhashable: list[Any] = []
+        for value in _flatten_literal_values(self) or ():
+            try:
+                hash(value)
+            except TypeError:
+                unhashable.append(value)
+            else:
+                hashable.append(value)
+        self._literal_index: tuple[frozenset[Any], frozenset[tuple[type, Any]], tuple[Any, ...]] = (
+            frozenset(hashable),
+            frozenset((type(v), v) for v in hashable),
+            tuple(unhashable),
+        )
+        return self._literal_index
+
     def has_inner_subtype_of(self, typ: type[Any] | tuple[type[Any], ...]) -> bool:
         """Whether any generic args are a subclass of the given type.
 
@@ -253,15 +552,25 @@ class TypeView(Generic[T]):
         Returns:
             Whether the annotation is a subtype of the given type(s).
         """
+        key = (self, typ)
+        try:
+            result = _SUBTYPE_CACHE.get(key)
+        except TypeError:  # unhashable ``typ``
+            return self._is_subtype_of(typ)
+        if result is None:
+            result = _SUBTYPE_CACHE.set(key, self._is_subtype_of(typ))
+        return result
+
+    def _is_subtype_of(self, typ: Any | tuple[Any, ...]) -> bool:
         if self.origin:
-            if self.is_union:
+            if self.flags & _UNION:
                 return all(t.is_subtype_of(typ) for t in self.inner_types)
 
             return self.is_subclass_of(typ)
 
         if self.annotation is AnyStr:
-            return TypeView(Union[str, bytes]).is_subtype_of(typ)
-        return self.annotation is not Any and not self.is_type_var and self.is_subclass_of(typ)
+            return _ANY_STR_VIEW.is_subtype_of(typ)
+        return self.annotation is not Any and not self.flags & _TYPE_VAR and self.is_subclass_of(typ)
 
     def is_subclass_of(self, typ: Any | tuple[Any, ...], /) -> bool:
         """Whether the annotation is a subclass of the given type.
@@ -272,34 +581,485 @@ class TypeView(Generic[T]):
         Returns:
             Whether the annotation is a subclass of the given type(s).
         """
-        return isinstance(self.fallback_origin, type) and issubclass(self.fallback_origin, typ)
+        fallback_origin = self.fallback_origin
+        if not isinstance(fallback_origin, type):
+            return False
+
+        key = (fallback_origin, typ)
+        try:
+            result = _SUBCLASS_CACHE.get(key)
+        except TypeError:  # unhashable ``typ``
+            return issubclass(fallback_origin, typ)
+        if result is None:
+            result = _SUBCLASS_CACHE.set(key, issubclass(fallback_origin, typ))
+        return result
 
     def strip_optional(self) -> TypeView[Any]:
-        """Remove the "Optional" component of an `Optional[T]` or `Union[T, None]` type."""
-        if not self.is_optional:
+        """Remove the "Optional" component of an `Optional[T]` or `Union[T, None]` type.
+
+        The view is built on the first call, and shares the views of the members of the union.
+        """
+        if not self.flags & _OPTIONAL:
             return self
+        try:
+            return self._non_optional
+        except AttributeError:
+            pass
+
+        inner_types = tuple(t for a, t in zip(self.args, self.inner_types) if a is not NoneType)
+        if len(inner_types) == 1:
+            non_optional = inner_types[0]
+        else:
+            args = tuple(t.raw for t in inner_types)
+            non_optional = TypeView(Union[args], metadata=self.metadata)
+            # The members are views of the same args, with the same metadata, as the union would build.
+            non_optional._inner_types = inner_types
+        self._non_optional: TypeView[Any] = non_optional
+        return non_optional
 
-        if len(self.args) == 2:
-            return self.inner_types[0]
+    def resolve(self) -> TypeView[Any]:
+        """Resolve a forward reference in the namespaces given at construction.
 
-        args = tuple(a for a in self.args if a is not NoneType)
-        non_optional = Union[args]  # type: ignore[valid-type]
-        return TypeView(non_optional, metadata=self.metadata)
+        The reference is evaluated on the first call only, so that recursive or mutually referencing models can be
+        viewed without evaluating all of their annotations upfront. Inner types inherit the namespaces of their
+        parent view, and can be resolved on demand in turn.
 
-    def strip_type_alias(self) -> TypeView[Any]:
+        Examples:
+            >>> from typing import List
+            >>> from type_lens import TypeView
+            >>> view = TypeView(List["int"], globalns={})
+            >>> view.inner_types[0].resolve()
+            TypeView(int)
+
+        Returns:
+            A view of the evaluated reference, or the view itself if it is not a forward reference.
+
+        Raises:
+            TypeViewError: If the forward reference cannot be resolved.
+        """
+        if not self.flags & _FORWARD_REF:
+            return self
+        try:
+            return self._resolved
+        except AttributeError:
+            pass
+
+        if self._globalns is None and self._localns is None:
+            raise TypeViewError(f"Cannot resolve forward reference {self.annotation!r} without a namespace.")
+        try:
+            annotation = evaluate_forward_ref(self.annotation, self._globalns, self._localns)
+        except Exception as e:
+            raise TypeViewError(f"Unable to resolve forward reference {self.annotation!r}.") from e
+
+        for wrapper in (Required, NotRequired):
+            if wrapper in self._wrappers:
+                annotation = wrapper[annotation]
+        self._resolved: TypeView[Any] = TypeView(
+            annotation, metadata=self.metadata, globalns=self._globalns, localns=self._localns
+        )
+        return self._resolved
+
+    def substitute(self, mapping: Mapping[Any, Any]) -> TypeView[Any]:
+        """Specialize the view by substituting type variables, e.g. ``MyGeneric[T]`` into ``MyGeneric[int]``.
+
+        Only the subtrees that contain a substituted type variable are rebuilt: the views of unchanged args are
+        shared with this view, and a view without any of the type variables is returned as is. Rebuilt views are
+        not interned, as their inner types are not necessarily those that :meth:`of` would build. Metadata,
+        ``Required``/``NotRequired`` wrappers and captured namespaces are kept.
+
+        Examples:
+            >>> from typing import Dict, List, TypeVar
+            >>> from type_lens import TypeView
+            >>> T = TypeVar("T")
+            >>> TypeView(Dict[str, List[T]]).substitute({T: int})
+            TypeView(Dict[str, List[int]])
+
+        Args:
+            mapping: Mapping of type variables to the annotations that replace them.
+
+        Returns:
+            A view of the specialized annotation.
+
+        Raises:
+            TypeViewError: If the annotation cannot be specialized with ``mapping``.
+        """
+        if self.flags & _TYPE_VAR:
+            if self.annotation not in mapping:
+                return self
+            return self._rebuild(mapping[self.annotation])
+
+        parameters = getattr(self.annotation, "__parameters__", ()) if self.origin else ()
+        if not any(parameter in mapping for parameter in parameters):
+            return self
+        try:
+            annotation = self.annotation[tuple(mapping.get(p, p) for p in parameters)]
+        except TypeError as e:
+            raise TypeViewError(f"Unable to substitute {mapping!r} in {self!r}.") from e
+
+        inner_types = tuple(inner.substitute(mapping) for inner in self.inner_types)
+        # Not interned, as the views of unchanged args are shared with this view, e.g. with their expanded aliases.
+        view = self._rebuild(annotation, intern=False)
+        if _holds_args(view, inner_types):
+            view._inner_types = inner_types
+        return view
+
+    def with_inner_types(self, inner_types: Sequence[TypeView[Any]]) -> TypeView[Any]:
+        """Rebuild the view of a generic with different inner types, e.g. ``List[int]`` into ``List[str]``.
+
+        The view is returned as is if ``inner_types`` are the views of :attr:`inner_types`. Otherwise, the
+        annotation is rebuilt from the ``raw`` annotation of each inner view, and the new view holds ``inner_types``
+        as its own. Metadata, ``Required``/``NotRequired`` wrappers and captured namespaces are kept.
+
+        Args:
+            inner_types: Views of the new generic args.
+
+        Returns:
+            A view of the rebuilt annotation.
+
+        Raises:
+            TypeViewError: If the annotation cannot be rebuilt with the given args.
+        """
+        inner_types = tuple(inner_types)
+        current = self.inner_types
+        if len(inner_types) == len(current) and all(new is old for new, old in zip(inner_types, current)):
+            return self
+        if not self.origin or not inner_types:
+            raise TypeViewError(f"Unable to rebuild {self!r} with inner types {inner_types!r}.")
+
+        args = tuple(inner.raw for inner in inner_types)
+        annotation: Any
+        if self.flags & _UNION:
+            annotation = Union[args]
+        elif _GenericAlias is not None and isinstance(self.annotation, _GenericAlias):
+            annotation = _GenericAlias(self.origin, args)
+        elif hasattr(self.annotation, "copy_with"):
+            annotation = self.annotation.copy_with(args)
+        else:
+            raise TypeViewError(f"Unable to rebuild {self!r} with inner types {inner_types!r}.")
+
+        # Not interned, as the inner types may differ from the views the annotation would produce, e.g. in metadata.
+        view = self._rebuild(annotation, intern=False)
+        if _holds_args(view, inner_types):
+            view._inner_types = inner_types
+        return view
+
+    def _rebuild(self, annotation: Any, *, intern: bool = True) -> TypeView[Any]:
+        """Build a view of ``annotation`` with the wrappers, metadata and namespaces of this view."""
+        annotation_metadata = unwrap_annotation(self.raw)[1]
+        if annotation_metadata:
+            annotation = Annotated[(annotation, *annotation_metadata)]
+        for wrapper in (Required, NotRequired):
+            if wrapper in self._wrappers:
+                annotation = wrapper[annotation]
+        metadata = self.metadata[len(annotation_metadata) :]
+        if intern and self._globalns is None and self._localns is None:
+            return TypeView.of(annotation, metadata=metadata)
+        return TypeView(annotation, metadata=metadata, globalns=self._globalns, localns=self._localns)
+
+    def strip_type_alias(self, *, deep: bool = False) -> TypeView[Any]:
         """Remove the type alias from a `type Type = T` type alias.
 
+        The value of an alias is evaluated once per alias object, and the view of it is built once per view.
+
+        With ``deep=True``, type aliases are expanded everywhere in the tree. A recursive alias, such as
+        ``type Json = dict[str, Json] | list[Json] | int``, is expanded into a cyclic graph of views: its references
+        to itself are the view of its value. Expanded graphs are shared per alias, so that they compare by identity.
+
         Examples:
             >>> type Foo = int
             >>> TypeAlias(Foo).strip_type_alias()
             TypeView(int)
+
+        Args:
+            deep: Whether to expand the type aliases of inner types as well.
+
+        Returns:
+            A view of the value of the type alias, or the view itself if it contains no type alias to expand.
         """
+        if deep:
+            try:
+                return self._expanded
+            except AttributeError:
+                pass
+            pending: list[tuple[tuple[Any, ...], TypeView[Any]]] = []
+            expanded = _expand_type_aliases(self, {}, pending)
+            # Graphs are only shared once complete, so that other threads never walk a partially expanded graph. A
+            # graph shared by another thread in the meantime is returned in place of this one.
+            for key, node in pending:
+                shared = _ALIAS_GRAPH_CACHE.set(key, node)
+                if node is expanded:
+                    expanded = shared
+            self._expanded: TypeView[Any] = expanded
+            return self._expanded
+
         if not self.is_type_alias:
             return self
-        return TypeView(self.annotation.__value__, metadata=self.metadata)
+        try:
+            return self._stripped
+        except AttributeError:
+            pass
+        self._stripped: TypeView[Any] = TypeView.of(_type_alias_value(self.annotation), metadata=self.metadata)
+        return self._stripped
+
+    def compile_validator(self) -> Validator:
+        """Compile a callable that checks whether a value is consistent with the annotation.
+
+        The view tree is walked once, on the first call, into specialized closures, so that checking many values
+        costs close to hand-written ``isinstance()`` checks. See :func:`type_lens.validation.compile_validator`.
+
+        Examples:
+            >>> from typing import Dict, List, Optional
+            >>> from type_lens import TypeView
+            >>> is_valid = TypeView(Optional[Dict[str, List[int]]]).compile_validator()
+            >>> is_valid({"a": [1, 2]}), is_valid(None), is_valid({"a": ["b"]})
+            (True, True, False)
+
+        Returns:
+            A callable that returns whether a value is consistent with the annotation.
+
+        Raises:
+            TypeViewError: If the annotation, or one of its inner types, cannot be checked at runtime.
+        """
+        try:
+            return self._validator
+        except AttributeError:
+            pass
+        self._validator: Validator = compile_validator(self)
+        return self._validator
+
+    def union_dispatcher(self) -> UnionDispatcher:
+        """Build an index that finds the member of a union matching a runtime value.
+
+        Instead of scanning the members with :meth:`is_subtype_of` or their validators, the dispatcher looks values
+        up by their type, ``Literal`` values, and the MRO of their type, falling back to validators only for the
+        members that need them. The dispatcher is built on the first call. See
+        :class:`type_lens.validation.UnionDispatcher`.
 
+        Examples:
+            >>> from typing import List, Literal, Union
+            >>> from type_lens import TypeView
+            >>> dispatcher = TypeView(Union[int, Literal["a", "b"], List[str]]).union_dispatcher()
+            >>> [dispatcher.match(value) for value in (True, "a", ["a"], "c")]
+            [TypeView(int), TypeView(Literal['a', 'b']), TypeView(List[str]), None]
+
+        Returns:
+            The dispatcher of the union, or of the view as the single member of a union.
 
-def _is_typing_extensins_type_alias(type_view: TypeView[Any]) -> bool:
+        Raises:
+            TypeViewError: If a member of the union cannot be checked at runtime.
+        """
+        try:
+            return self._dispatcher
+        except AttributeError:
+            pass
+        self._dispatcher: UnionDispatcher = UnionDispatcher(self)
+        return self._dispatcher
+
+
+if sys.version_info < (3, 12):
+
+    def _is_type_alias(annotation: Any) -> bool:
+        return _is_typing_extensins_type_alias(annotation)
+else:
+
+    def _is_type_alias(annotation: Any) -> bool:
+        return isinstance(annotation, typing.TypeAliasType) or _is_typing_extensins_type_alias(annotation)
+
+
+def _unpickle_type_view(
+    cls: type[TypeView[Any]],
+    annotation: Any,
+    metadata: tuple[Any, ...],
+    globalns: dict[str, Any] | str | None = None,
+    localns: dict[str, Any] | str | None = None,
+) -> TypeView[Any]:
+    if globalns is None and localns is None:
+        return cls.of(annotation, metadata=metadata)
+    return cls(
+        annotation,
+        metadata=metadata,
+        globalns=_unpickled_namespace(globalns),
+        localns=_unpickled_namespace(localns),
+    )
+
+
+def _pickled_namespace(namespace: dict[str, Any] | None) -> dict[str, Any] | str | None:
+    """Refer to the globals of a module by the module's name, as they hold functions and modules."""
+    if namespace is not None:
+        name = namespace.get("__name__")
+        module = sys.modules.get(name) if isinstance(name, str) else None
+        if module is not None and vars(module) is namespace:
+            return name
+    return namespace
+
+
+def _unpickled_namespace(namespace: dict[str, Any] | str | None) -> dict[str, Any] | None:
+    if isinstance(namespace, str):
+        return vars(importlib.import_module(namespace))
+    return namespace
+
+
+def _args_key(annotation: Any) -> tuple[Any, ...]:
+    """Key the args of an annotation by position and type.
+
+    ``typing`` compares union and ``Literal`` members as sets, and ``Annotated`` metadata by equality, e.g. ``1`` as
+    ``True``.
+    """
+    args: tuple[object, ...] | None = getattr(annotation, "__args__", None)
+    key: tuple[Any, ...] = tuple((type(arg), arg, _args_key(arg)) for arg in args) if type(args) is tuple else ()
+    metadata: tuple[object, ...] | None = getattr(annotation, "__metadata__", None)
+    if type(metadata) is tuple:
+        key = (*key, *((type(value), value) for value in metadata))
+    return key
+
+
+def _holds_args(view: TypeView[Any], inner_types: tuple[TypeView[Any], ...]) -> bool:
+    """Whether ``inner_types`` are views of the args of ``view``, by position.
+
+    A rebuilt union may flatten or deduplicate its members, in which case its inner types are built from its args.
+    """
+    return len(view.args) == len(inner_types) and all(
+        type(inner.raw) is type(arg) and inner.raw == arg for inner, arg in zip(inner_types, view.args)
+    )
+
+
+def _type_alias_value(alias: Any) -> Any:
+    """Evaluate the value of a type alias, once per alias object."""
+    cached = _ALIAS_VALUE_CACHE.get(alias)
+    if cached is None:
+        cached = _ALIAS_VALUE_CACHE.set(alias, (alias.__value__,))
+    return cached[0]
+
+
+def _expand_type_aliases(
+    view: TypeView[Any],
+    expanded: dict[int, TypeView[Any]],
+    pending: list[tuple[tuple[Any, ...], TypeView[Any]]],
+) -> TypeView[Any]:
+    """Expand the type aliases of a view tree, closing references of recursive aliases into cycles.
+
+    Args:
+        view: The view to expand.
+        expanded: Views of the aliases expanded so far, keyed by alias identity.
+        pending: Cache keys and views of the aliases expanded so far, to share once the whole tree is expanded.
+    """
+    if not view.flags & _TYPE_ALIAS:
+        inner_types = view.inner_types
+        if not inner_types:
+            return view
+        return view.with_inner_types(tuple(_expand_type_aliases(inner, expanded, pending) for inner in inner_types))
+
+    alias = view.annotation
+    node = expanded.get(id(alias))
+    if node is not None:
+        return node
+    key: tuple[Any, ...] | None = (alias, view.metadata, tuple(map(type, view.metadata)))
+    try:
+        node = _ALIAS_GRAPH_CACHE.get(key)  # type: ignore[arg-type]
+    except TypeError:  # unhashable metadata
+        key = None
+    if node is not None:
+        return node
+
+    # The node is registered before its inner types are expanded, so that references to the alias close the cycle.
+    node = expanded[id(alias)] = TypeView(_type_alias_value(alias), metadata=view.metadata)
+    if node.flags & _TYPE_ALIAS:
+        node = expanded[id(alias)] = _expand_type_aliases(node, expanded, pending)
+    else:
+        node._alias_of = alias  # pyright: ignore[reportPrivateUsage]
+        inner_types = tuple(_expand_type_aliases(inner, expanded, pending) for inner in node.inner_types)
+        node._inner_types = inner_types  # pyright: ignore[reportPrivateUsage]
+    if key is not None:
+        pending.append((key, node))
+    return node
+
+
+def _structural_hash(unwrapped: Any, origin: Any, args: tuple[Any, ...]) -> int:
+    """Hash an unwrapped annotation consistently with :meth:`TypeView.__eq__`, without building views of its args."""
+    if origin:
+        return hash((Union if origin in UNION_TYPES else origin, *map(_hash_annotation, args)))
+    try:
+        return hash(unwrapped)
+    except TypeError:
+        # Unhashable annotations can still compare equal to one another.
+        return 0
+
+
+def _hash_annotation(annotation: Any) -> int:
+    unwrapped = unwrap_annotation(annotation)[0]
+    origin = get_origin(unwrapped)
+    return _structural_hash(unwrapped, origin, () if origin is abc.Callable else get_args(unwrapped))
+
+
+def _class_collection_flags(cls: type) -> int:
+    """Compute the collection and mapping flags of a class."""
+    flags = 0
+    if issubclass(cls, Collection):
+        flags |= _COLLECTION
+        if not issubclass(cls, (str, bytes)):
+            flags |= _NON_STRING_COLLECTION
+    if issubclass(cls, Mapping):
+        flags |= _MAPPING
+    return flags
+
+
+def _union_collection_flags(args: tuple[Any, ...]) -> int:
+    """Compute the collection and mapping flags of a union from its args, without building views of its members.
+
+    A union is a collection or mapping only when all of its members are, and a non-string collection when one of
+    them is, consistently with :meth:`TypeView.is_subtype_of`.
+    """
+    member_flags: list[int] = []
+    for arg in args:
+        unwrapped = unwrap_annotation(arg)[0]
+        origin = get_origin(unwrapped)
+        if origin in UNION_TYPES:
+            member_flags.append(_union_collection_flags(get_args(unwrapped)))
+        elif unwrapped is AnyStr:
+            member_flags.append(_COLLECTION)
+        elif isinstance(origin or unwrapped, type) and unwrapped is not Any:
+            member_flags.append(_class_collection_flags(origin or unwrapped))
+        else:
+            return 0
+
+    flags = 0
+    if all(f & _COLLECTION for f in member_flags):
+        flags |= _COLLECTION
+        if any(f & _NON_STRING_COLLECTION for f in member_flags):
+            flags |= _NON_STRING_COLLECTION
+    if all(f & _MAPPING for f in member_flags):
+        flags |= _MAPPING
+    return flags
+
+
+def _flatten_literal_values(view: TypeView[Any]) -> list[Any] | None:
+    """Collect the values of a ``Literal``, or of a union of ``Literal`` and ``None``, or ``None`` for other types."""
+    if view.is_union:
+        values: list[Any] = []
+        for inner in view.inner_types:
+            inner_values = [None] if inner.is_none_type else _flatten_literal_values(inner)
+            if inner_values is None:
+                return None
+            values.extend(inner_values)
+        return values
+    if not view.is_literal:
+        return None
+
+    values = []
+    for arg in view.args:
+        # ``Literal[Literal[...]]`` is only flattened by ``typing`` itself on some versions.
+        if get_origin(arg) in (Literal, ExtensionsLiteral):
+            values.extend(_flatten_literal_values(TypeView.of(arg)) or ())
+        else:
+            values.append(arg)
+    return values
+
+
+def _is_typing_extensins_type_alias(annotation: Any) -> bool:
     if hasattr(typing_extensions, "TypeAliasType"):
-        return isinstance(type_view.annotation, typing_extensions.TypeAliasType)
+        return isinstance(annotation, typing_extensions.TypeAliasType)
     return False
+
+
+_ANY_STR_VIEW: Final = TypeView(Union[str, bytes])
+"""``AnyStr`` is a subtype of whatever both ``str`` and ``bytes`` are subtypes of."""
@@ -1,16 +1,34 @@
 from __future__ import annotations
 
+import inspect
 import sys
 import types
 import typing
-from typing import Any
+from typing import Any, Dict, Final, Optional, Sequence, Tuple
 
-from type_lens.type_view import TypeView
+from typing_extensions import Annotated, get_args, get_origin
+
+from type_lens.cache import BoundedCache, CacheInfo
+from type_lens.types.builtins import UNION_TYPES
+from type_lens.utils import unwrap_annotation
 
 __all__ = [
+    "cached_get_type_hints",
+    "clear_type_hints_cache",
+    "evaluate_forward_ref",
     "get_type_hints",
+    "get_type_hints_batch",
+    "type_hints_cache_info",
 ]
 
+_Fingerprint = Optional[Tuple[int, int]]
+_HintsEntry = Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]], Tuple[_Fingerprint, ...], Dict[str, Any]]
+
+_TYPE_HINTS_CACHE: Final[BoundedCache[tuple[Any, bool, _Fingerprint, _Fingerprint], _HintsEntry]] = BoundedCache(
+    maxsize=1024
+)
+"""Results of :func:`cached_get_type_hints`, keyed by object, ``include_extras`` and namespace fingerprints."""
+
 
 def get_type_hints(
     obj: Any,
@@ -26,6 +44,159 @@ def get_type_hints(
     return result
 
 
+def cached_get_type_hints(
+    obj: Any,
+    globalns: dict[str, Any] | None = None,
+    localns: dict[str, Any] | None = None,
+    include_extras: bool = False,
+) -> dict[str, Any]:
+    """A caching :func:`get_type_hints`, for repeated resolution of the same classes and functions.
+
+    Results are keyed on ``obj``, ``include_extras`` and a fingerprint of each namespace: its identity and size. A
+    cached result is reused until the size of a namespace, or of the annotations of ``obj`` (or of its bases, for a
+    class), changes. Without ``globalns``, the namespace of a function is its globals, and the namespaces of a class
+    are the modules of the class and of each of its bases that declares annotations. Rebinding an existing name is not detected: call :func:`clear_type_hints_cache` after patching
+    a namespace or annotations in place.
+
+    Args:
+        obj: The object to resolve the type hints of.
+        globalns: Global namespace for resolving forward references.
+        localns: Local namespace for resolving forward references.
+        include_extras: Whether to preserve ``Annotated`` metadata in resolved type hints.
+
+    Returns:
+        A new mapping of names to resolved type hints.
+    """
+    key = (obj, include_extras, _fingerprint(globalns), _fingerprint(localns))
+    try:
+        entry = _TYPE_HINTS_CACHE.get(key)
+    except TypeError:  # unhashable ``obj``
+        return get_type_hints(obj, globalns=globalns, localns=localns, include_extras=include_extras)
+
+    current = _object_fingerprint(obj, globalns)
+    if entry is not None:
+        # The entry references the namespaces, so that their ids in the key cannot be reused by other objects.
+        cached_globalns, cached_localns, fingerprint, hints = entry
+        if cached_globalns is globalns and cached_localns is localns and fingerprint == current:
+            return dict(hints)
+        _TYPE_HINTS_CACHE.pop(key)
+
+    hints = get_type_hints(obj, globalns=globalns, localns=localns, include_extras=include_extras)
+    _TYPE_HINTS_CACHE.set(key, (globalns, localns, current, hints))
+    return dict(hints)
+
+
+def clear_type_hints_cache() -> None:
+    """Drop all results cached by :func:`cached_get_type_hints`."""
+    _TYPE_HINTS_CACHE.clear()
+
+
+def type_hints_cache_info() -> CacheInfo:
+    """Report hit and miss statistics of :func:`cached_get_type_hints`."""
+    return _TYPE_HINTS_CACHE.info()
+
+
+def _fingerprint(namespace: dict[str, Any] | None) -> _Fingerprint:
+    return None if namespace is None else (id(namespace), len(namespace))
+
+
+def _object_fingerprint(obj: Any, globalns: dict[str, Any] | None) -> tuple[_Fingerprint, ...]:
+    """Fingerprint the annotations of ``obj``, and the namespace they resolve in when none is given."""
+    if isinstance(obj, type):
+        fingerprint: tuple[_Fingerprint, ...] = ()
+        for base in obj.__mro__:
+            annotations = base.__dict__.get("__annotations__")
+            fingerprint += (_fingerprint(annotations),)
+            if globalns is None and annotations:
+                # The annotations of each base resolve in the module that defines it.
+                module = sys.modules.get(base.__module__)
+                fingerprint += (_fingerprint(getattr(module, "__dict__", None)),)
+        return fingerprint
+
+    fingerprint = (_fingerprint(getattr(obj, "__annotations__", None)),)
+    if globalns is None:
+        fingerprint += (_fingerprint(getattr(inspect.unwrap(obj), "__globals__", None)),)
+    return fingerprint
+
+
+def get_type_hints_batch(
+    functions: Sequence[types.FunctionType],
+    globalns: dict[str, Any],
+    include_extras: bool = False,
+) -> list[dict[str, Any]]:
+    """Resolve the type hints of several functions that share a global namespace.
+
+    Each distinct annotation is evaluated once for the whole batch, so string annotations that repeat across the
+    functions of a module, e.g. under ``from __future__ import annotations``, are only parsed and evaluated once.
+
+    Args:
+        functions: The functions to resolve hints for. They should not declare type parameters, which are not in
+            scope of the shared evaluation.
+        globalns: The global namespace shared by ``functions``.
+        include_extras: Whether to preserve ``Annotated`` metadata in resolved type hints.
+
+    Returns:
+        The type hints of each function, in the order of ``functions``.
+    """
+    slots: dict[tuple[type[Any], Any], str] = {}
+    batch: dict[str, Any] = {}
+    names: list[dict[str, str]] = []
+    annotation: object
+    for function in functions:
+        function_names: dict[str, str] = {}
+        for name, annotation in function.__annotations__.items():
+            try:
+                slot = slots.setdefault((type(annotation), annotation), f"_{len(slots)}")
+            except TypeError:  # unhashable annotation
+                slot = f"_{len(slots)}_{len(batch)}"
+            batch[slot] = annotation
+            function_names[name] = slot
+        names.append(function_names)
+
+    resolved = get_type_hints(_AnnotationsHolder(batch), globalns=globalns, include_extras=include_extras)
+
+    results: list[dict[str, Any]] = []
+    for function, function_names in zip(functions, names):
+        hints = {name: resolved[slot] for name, slot in function_names.items()}
+        if sys.version_info < (3, 11):  # pragma: no cover
+            # ``get_type_hints()`` makes parameters with a ``None`` default optional before 3.11.
+            defaults = typing._get_defaults(function)  # type: ignore[attr-defined]  # pyright: ignore
+            for name, hint in hints.items():
+                if name in defaults and defaults[name] is None:
+                    hints[name] = typing.Optional[hint]
+            hints = fix_annotated_optional_type_hints(hints)
+        results.append(hints)
+    return results
+
+
+def evaluate_forward_ref(
+    annotation: str | typing.ForwardRef,
+    globalns: dict[str, Any] | None = None,
+    localns: dict[str, Any] | None = None,
+) -> Any:
+    """Evaluate a forward reference consistently with :func:`get_type_hints`.
+
+    Args:
+        annotation: The forward reference, as a string or :class:`typing.ForwardRef`.
+        globalns: Global namespace to evaluate the reference in.
+        localns: Local namespace to evaluate the reference in.
+
+    Returns:
+        The evaluated annotation, with any ``Annotated`` metadata preserved.
+    """
+    holder = _AnnotationsHolder({"annotation": annotation})
+    return get_type_hints(holder, globalns=globalns, localns=localns, include_extras=True)["annotation"]
+
+
+class _AnnotationsHolder:
+    """Carries the annotations of a batch through ``get_type_hints()``."""
+
+    __slots__ = ("__annotations__",)
+
+    def __init__(self, annotations: dict[str, Any]) -> None:
+        self.__annotations__ = annotations
+
+
 def fix_annotated_optional_type_hints(
     hints: dict[str, typing.Any],
 ) -> dict[str, typing.Any]:  # pragma: no cover
@@ -34,9 +205,10 @@ def fix_annotated_optional_type_hints(
     https://github.com/python/cpython/issues/90353.
     """
     for param_name, hint in hints.items():
-        type_view = TypeView(hint)
-        if type_view.is_union and type_view.inner_types[0].is_annotated:
-            hints[param_name] = type_view.inner_types[0].raw
+        if get_origin(hint) in UNION_TYPES:
+            first_arg = get_args(hint)[0]
+            if Annotated in unwrap_annotation(first_arg)[2]:
+                hints[param_name] = first_arg
     return hints
 
 
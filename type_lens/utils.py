@@ -46,9 +46,15 @@ This is necessary because occasionally we want to rebuild a generic outer type w
 ``collections.abc.Mapping``, are not valid generic types in Python 3.8.
 """
 
-_WRAPPER_TYPES: te.Final = {te.Annotated, te.Required, te.NotRequired}
+_WRAPPER_TYPES: te.Final = frozenset((te.Annotated, te.Required, te.NotRequired))
 """Types that always contain a wrapped type annotation as their first arg."""
 
+_NO_WRAPPERS: te.Final[frozenset[t.Any]] = frozenset()
+"""The wrappers of an annotation that is not wrapped, shared by all such annotations."""
+
+_WRAPPER_SETS: te.Final = {wrapper: frozenset((wrapper,)) for wrapper in _WRAPPER_TYPES}
+"""The wrappers of an annotation wrapped once, shared by all such annotations."""
+
 INSTANTIABLE_TYPE_MAPPING: te.Final = {
     t.AbstractSet: set,
     t.DefaultDict: defaultdict,
@@ -80,7 +86,7 @@ INSTANTIABLE_TYPE_MAPPING: te.Final = {
 """A mapping of types to equivalent types that are safe to instantiate."""
 
 
-def unwrap_annotation(annotation: t.Any) -> tuple[t.Any, tuple[t.Any, ...], set[t.Any]]:
+def unwrap_annotation(annotation: t.Any) -> tuple[t.Any, tuple[t.Any, ...], frozenset[t.Any]]:
     """Remove "wrapper" annotation types, such as ``Annotated``, ``Required``, and ``NotRequired``.
 
     Note:
@@ -91,14 +97,23 @@ def unwrap_annotation(annotation: t.Any) -> tuple[t.Any, tuple[t.Any, ...], set[
         annotation: A type annotation.
 
     Returns:
-        A tuple of the unwrapped annotation and any ``Annotated`` metadata, and a set of any wrapper types encountered.
+        A tuple of the unwrapped annotation and any ``Annotated`` metadata, and a frozenset of any wrapper types
+        encountered.
     """
+    # Plain classes, ``None`` and strings are most annotations, and are returned as is.
+    if annotation is None or isinstance(annotation, type) or type(annotation) is str:
+        return annotation, (), _NO_WRAPPERS
+
     origin = te.get_origin(annotation)
-    wrappers: set[t.Any] = set()
-    metadata: list[t.Any] = []
+    if origin not in _WRAPPER_TYPES:
+        return annotation, (), _NO_WRAPPERS
+
+    wrappers = _NO_WRAPPERS
+    metadata: tuple[t.Any, ...] = ()
     while origin in _WRAPPER_TYPES:
-        wrappers.add(origin)
-        annotation, *meta = te.get_args(annotation)
-        metadata.extend(meta)
+        wrappers = wrappers | _WRAPPER_SETS[origin] if wrappers else _WRAPPER_SETS[origin]
+        args = te.get_args(annotation)
+        annotation = args[0]
+        metadata += args[1:]
         origin = te.get_origin(annotation)
-    return annotation, tuple(metadata), wrappers
+    return annotation, metadata, wrappers
@@ -0,0 +1,343 @@
+from __future__ import annotations
+
+from collections import abc
+from itertools import repeat
+from typing import TYPE_CHECKING, Any, Callable, Final, Tuple
+
+from typing_extensions import TypeAlias
+
+from type_lens.exc import TypeViewError
+from type_lens.types.builtins import NoneType
+
+__all__ = ("UnionDispatcher", "Validator", "compile_validator")
+
+
+if TYPE_CHECKING:
+    from type_lens.type_view import TypeView
+
+Validator: TypeAlias = Callable[[Any], bool]
+"""A callable that checks whether a value is consistent with an annotation."""
+
+
+def compile_validator(type_view: TypeView[Any]) -> Validator:
+    """Compile a view into a validator, a callable that checks values against the annotation.
+
+    The view tree is walked once, and specialized into nested closures. Unions of plain classes collapse into a
+    single ``isinstance()`` call with a tuple of classes, and collections of plain classes check their items with
+    ``map(isinstance, ...)``, so that checking a value costs close to a hand-written ``isinstance()`` chain.
+
+    Validation follows ``isinstance()`` semantics: ``Annotated`` metadata is ignored, ``Literal`` values must match
+    in type and value, collection items, mapping keys and values and tuple members are checked recursively, and other
+    generics are checked against their origin only. Forward references are resolved with :meth:`TypeView.resolve`.
+
+    Args:
+        type_view: The view to compile.
+
+    Returns:
+        A callable that returns whether a value is consistent with the annotation.
+
+    Raises:
+        TypeViewError: If the annotation, or one of its inner types, cannot be checked at runtime.
+    """
+    return _ValidatorCompiler().compile(type_view)
+
+
+class UnionDispatcher:
+    """Finds the member of a union that a value matches, without scanning the members one by one.
+
+    The index is built once from the union's ``inner_types``. A value is matched, in order, against:
+
+    1. the values of ``Literal`` members, by type and value;
+    2. the concrete classes among the members, by the exact type of the value, then by the nearest class in its
+       MRO. Results are memoized per type;
+    3. classes that customize ``isinstance()``, e.g. abstract base classes with registered virtual subclasses;
+    4. the remaining members, e.g. parametrized generics, with their compiled validators in declaration order.
+
+    Views that are not unions are treated as a union of a single member.
+    """
+
+    __slots__ = {
+        "members": "The member views of the union, in declaration order.",
+        "_classes": "Members of concrete classes, keyed by class.",
+        "_literals": "Members of ``Literal`` values, keyed by the type and value of each hashable value.",
+        "_by_type": "Memoized class lookups, keyed by the type of a matched value.",
+        "_virtual": "Pairs of classes that customize ``isinstance()``, and their member.",
+        "_others": "Pairs of compiled validators and members that are matched by value.",
+    }
+
+    _MAX_TYPES: Final = 1024
+    """The maximum number of memoized class lookups."""
+
+    def __init__(self, type_view: TypeView[Any]) -> None:
+        """Initialize UnionDispatcher.
+
+        Args:
+            type_view: The union to dispatch on.
+
+        Raises:
+            TypeViewError: If a member of the union cannot be checked at runtime.
+        """
+        self.members: Final = type_view.inner_types if type_view.is_union else (type_view,)
+        self._classes: dict[type, TypeView[Any]] = {}
+        self._literals: dict[tuple[type, Any], TypeView[Any]] = {}
+        self._by_type: dict[type, TypeView[Any] | None] = {}
+        virtual: list[tuple[type, TypeView[Any]]] = []
+        others: list[tuple[Validator, TypeView[Any]]] = []
+
+        for member in self.members:
+            cls = _plain_class(member)
+            if cls is not None:
+                self._classes.setdefault(cls, member)
+                if type(cls).__instancecheck__ is not type.__instancecheck__:
+                    virtual.append((cls, member))
+            elif not (member.is_literal and _index_literal(self._literals, member)):
+                others.append((member.compile_validator(), member))
+
+        self._virtual: Final = tuple(virtual)
+        self._others: Final = tuple(others)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({', '.join(map(repr, self.members))})"
+
+    def match(self, value: object) -> TypeView[Any] | None:
+        """Find the member of the union that ``value`` matches.
+
+        Args:
+            value: The value to match.
+
+        Returns:
+            The matching member view, or ``None`` if the value matches no member.
+        """
+        if self._literals:
+            try:
+                member = self._literals.get((type(value), value))
+            except TypeError:  # unhashable value
+                member = None
+            if member is not None:
+                return member
+
+        cls = type(value)
+        try:
+            member = self._by_type[cls]
+        except KeyError:
+            member = self._lookup_class(cls)
+            if len(self._by_type) < self._MAX_TYPES:
+                self._by_type[cls] = member
+        if member is not None:
+            return member
+
+        for virtual_cls, member in self._virtual:
+            if isinstance(value, virtual_cls):
+                return member
+        for validator, member in self._others:
+            if validator(value):
+                return member
+        return None
+
+    def _lookup_class(self, cls: type) -> TypeView[Any] | None:
+        for base in cls.__mro__:
+            member = self._classes.get(base)
+            if member is not None:
+                return member
+        return None
+
+
+def _index_literal(index: dict[tuple[type, Any], TypeView[Any]], member: TypeView[Any]) -> bool:
+    """Add the values of a ``Literal`` member to ``index``, returning whether they are all hashable."""
+    try:
+        pairs: dict[tuple[type, Any], TypeView[Any]] = {(type(v), v): member for v in member.args}
+    except TypeError:  # unhashable values
+        return False
+    for pair in pairs:
+        index.setdefault(pair, member)
+    return True
+
+
+def _always_valid(value: Any) -> bool:
+    return True
+
+
+def _is_none(value: Any) -> bool:
+    return value is None
+
+
+class _ValidatorCompiler:
+    __slots__ = ("_cells", "_validators")
+
+    def __init__(self) -> None:
+        self._validators: dict[int, tuple[TypeView[Any], Validator]] = {}
+        """Validators compiled so far, keyed by view identity, along with the view to keep its id alive."""
+        self._cells: dict[int, list[Validator]] = {}
+        """Validators of the views being compiled, so that recursive type aliases, and the cyclic graphs of their
+        expansion, refer back to themselves."""
+
+    def compile(self, view: TypeView[Any]) -> Validator:
+        # Views of a type alias are not necessarily shared, unlike the alias itself.
+        key = id(view.annotation) if view.is_type_alias else id(view)
+        entry = self._validators.get(key)
+        if entry is not None:
+            return entry[1]
+        pending = self._cells.get(key)
+        if pending is not None:
+            # The validator of a view being compiled only exists once its compilation completes.
+            return lambda value: pending[0](value)  # noqa: PLW0108
+
+        cell: list[Validator] = []
+        self._cells[key] = cell
+        validator = self._compile(view)
+        cell.append(validator)
+        self._validators[key] = (view, validator)
+        del self._cells[key]
+        return validator
+
+    def _compile(self, view: TypeView[Any]) -> Validator:  # noqa: C901
+        if view.is_forward_ref:
+            return self.compile(view.resolve())
+        if view.is_type_alias:
+            return self.compile(view.strip_type_alias())
+
+        annotation, origin = view.annotation, view.origin
+        if annotation is Any or annotation is object:
+            return _always_valid
+        if view.is_none_type:
+            return _is_none
+        if view.is_type_var:
+            return self._compile_type_var(view)
+        if view.is_literal:
+            return view.has_literal_value
+        if view.is_union:
+            # Unions of ``Literal`` types are checked against a single index of their values.
+            return view.has_literal_value if view.literal_values else self._compile_union(view)
+        if origin is abc.Callable:  # pyright: ignore
+            return callable
+        if origin is type:
+            return self._compile_type(view)
+        if view.is_tuple and origin:
+            return self._compile_tuple(view)
+        if view.is_mapping and origin and view.args:
+            return self._compile_mapping(view)
+        if view.is_non_string_collection and origin and len(view.args) == 1:
+            return self._compile_collection(view)
+
+        supertype = getattr(annotation, "__supertype__", None)
+        if supertype is not None:  # NewType
+            return self.compile(type(view).of(supertype))
+        return _compile_isinstance(view)
+
+    def _compile_type_var(self, view: TypeView[Any]) -> Validator:
+        type_var = view.annotation
+        if type_var.__bound__ is not None:
+            return self.compile(type(view).of(type_var.__bound__))
+        if type_var.__constraints__:
+            return _any_of([self.compile(type(view).of(c)) for c in type_var.__constraints__])
+        return _always_valid
+
+    def _compile_union(self, view: TypeView[Any]) -> Validator:
+        classes: list[type] = []
+        validators: list[Validator] = []
+        for inner in view.inner_types:
+            cls = _plain_class(inner)
+            if cls is not None:
+                classes.append(cls)
+            else:
+                validators.append(self.compile(inner))
+        if _always_valid in validators:
+            return _always_valid
+
+        class_tuple = tuple(classes)
+        if not validators:
+            return lambda value: isinstance(value, class_tuple)
+        any_of = _any_of(validators)
+        if not class_tuple:
+            return any_of
+        return lambda value: isinstance(value, class_tuple) or any_of(value)
+
+    def _compile_type(self, view: TypeView[Any]) -> Validator:
+        if not view.args:
+            return lambda value: isinstance(value, type)
+        cls = _plain_class(view.inner_types[0])
+        if cls is None:
+            return lambda value: isinstance(value, type)
+        return lambda value: isinstance(value, type) and issubclass(value, cls)
+
+    def _compile_tuple(self, view: TypeView[Any]) -> Validator:
+        origin = view.origin
+        # A bare ``Tuple`` takes any tuple, while ``Tuple[()]``, which has no args either, only takes ``()``.
+        if view.annotation is Tuple:
+            return lambda value: isinstance(value, origin)
+        if view.is_variadic_tuple:
+            item = self._compile_items(view.inner_types[0])
+            return lambda value: isinstance(value, origin) and item(value)
+
+        members = tuple(self.compile(inner) for inner in view.inner_types)
+        length = len(members)
+        return lambda value: (
+            isinstance(value, origin) and len(value) == length and all(member(v) for member, v in zip(members, value))
+        )
+
+    def _compile_mapping(self, view: TypeView[Any]) -> Validator:
+        origin = view.origin
+        inner_types = view.inner_types
+        keys = self._compile_items(inner_types[0])
+        # Some mappings only take the type of their keys, e.g. ``Counter[str]``.
+        values = self._compile_items(inner_types[1]) if len(inner_types) > 1 else _always_valid
+        if keys is _always_valid and values is _always_valid:
+            return lambda value: isinstance(value, origin)
+        if values is _always_valid:
+            return lambda value: isinstance(value, origin) and keys(value.keys())
+        if keys is _always_valid:
+            return lambda value: isinstance(value, origin) and values(value.values())
+        return lambda value: isinstance(value, origin) and keys(value.keys()) and values(value.values())
+
+    def _compile_collection(self, view: TypeView[Any]) -> Validator:
+        origin = view.origin
+        items = self._compile_items(view.inner_types[0])
+        if items is _always_valid:
+            return lambda value: isinstance(value, origin)
+        return lambda value: isinstance(value, origin) and items(value)
+
+    def _compile_items(self, view: TypeView[Any]) -> Callable[[Any], bool]:
+        """Compile a check of all the items of an iterable."""
+        cls = _plain_class(view)
+        if cls is not None:
+            return lambda values: all(map(isinstance, values, repeat(cls)))
+
+        item = self.compile(view)
+        if item is _always_valid:
+            return _always_valid
+        return lambda values: all(map(item, values))
+
+
+def _any_of(validators: list[Validator]) -> Validator:
+    if len(validators) == 1:
+        return validators[0]
+    validator_tuple = tuple(validators)
+    return lambda value: any(validator(value) for validator in validator_tuple)
+
+
+def _plain_class(view: TypeView[Any]) -> type | None:
+    """Return the class of a view that is checked by ``isinstance()`` alone, if any."""
+    annotation = view.annotation
+    if annotation is None or annotation is NoneType:
+        return NoneType
+    if view.origin or annotation is Any or annotation is object or not isinstance(annotation, type):
+        return None
+    if view.is_type_alias or getattr(annotation, "__supertype__", None) is not None:
+        return None
+    _check_isinstance(view, annotation)
+    return annotation
+
+
+def _compile_isinstance(view: TypeView[Any]) -> Validator:
+    cls = view.fallback_origin
+    if not isinstance(cls, type):
+        raise TypeViewError(f"Cannot compile a validator for {view!r}.")
+    _check_isinstance(view, cls)
+    return lambda value: isinstance(value, cls)
+
+
+def _check_isinstance(view: TypeView[Any], cls: type) -> None:
+    try:
+        isinstance(None, cls)
+    except TypeError as e:  # e.g. protocols that are not runtime checkable
+        raise TypeViewError(f"Cannot compile a validator for {view!r}: {e}") from e
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Any, Generic, Iterator, TypeVar
+
+from type_lens.exc import TypeViewError
+from type_lens.type_view import TypeView
+
+__all__ = ("TypeViewTransformer", "TypeViewVisitor")
+
+
+R = TypeVar("R")
+
+
+class TypeViewVisitor(ABC, Generic[R]):
+    """Base class for computations over the tree of a :class:`TypeView`.
+
+    Subclasses implement :meth:`visit_view`, which receives a view and an iterator over the results of its children:
+    the views of its :attr:`~TypeView.inner_types`, or the value of a type alias. Children are only visited as the
+    iterator is consumed, so that a visitor can exit early, e.g. with ``any(children)``.
+
+    Results are memoized per view identity for the lifetime of the visitor, so that subtrees shared between views,
+    e.g. interned with :meth:`TypeView.of`, are visited once. A type alias that refers back to itself while it is
+    being visited, or a view reached again through a cycle of a graph expanded by
+    :meth:`TypeView.strip_type_alias`, is passed to :meth:`visit_cycle` instead of being visited again.
+
+    Examples:
+        >>> from typing import Dict, List, Optional
+        >>> from type_lens import TypeView
+        >>> from type_lens.visitor import TypeViewVisitor
+        >>> class Depth(TypeViewVisitor[int]):
+        ...     def visit_view(self, view, children):
+        ...         return 1 + max(children, default=0)
+        >>> Depth().visit(TypeView(Optional[Dict[str, List[int]]]))
+        4
+    """
+
+    __slots__ = {
+        "_memo": "Results of the visited views, keyed by view identity, along with the view to keep its id alive.",
+        "_in_progress": "Identities of the views, or of the type aliases, being visited.",
+        "_alias_values": "Views of the value of each visited type alias, keyed by alias identity.",
+    }
+
+    def __init__(self) -> None:
+        self._memo: dict[int, tuple[TypeView[Any], R]] = {}
+        self._in_progress: set[int] = set()
+        self._alias_values: dict[int, TypeView[Any]] = {}
+
+    def visit(self, view: TypeView[Any]) -> R:
+        """Visit a view, and its children as requested by :meth:`visit_view`.
+
+        Args:
+            view: The view to visit.
+
+        Returns:
+            The result of :meth:`visit_view` for ``view``.
+        """
+        entry = self._memo.get(id(view))
+        if entry is not None:
+            return entry[1]
+
+        # Views of a type alias are not necessarily shared, unlike the alias itself.
+        key = id(view.annotation) if view.is_type_alias else id(view)
+        if key in self._in_progress:
+            return self.visit_cycle(view)
+        self._in_progress.add(key)
+        try:
+            children = (self.alias_value(view),) if view.is_type_alias else view.inner_types
+            result = self.visit_view(view, map(self.visit, children))
+        finally:
+            self._in_progress.discard(key)
+
+        self._memo[id(view)] = (view, result)
+        return result
+
+    @abstractmethod
+    def visit_view(self, view: TypeView[Any], children: Iterator[R]) -> R:
+        """Compute the result of a view.
+
+        Args:
+            view: The view to compute the result of.
+            children: Lazy iterator over the results of the children of ``view``.
+
+        Returns:
+            The result of ``view``.
+        """
+
+    def visit_cycle(self, view: TypeView[Any]) -> R:
+        """Compute the result of a view that is reached again while it is being visited.
+
+        Args:
+            view: The view of the recursive type alias, or the view that closes a cycle.
+
+        Returns:
+            The result of the recursive reference.
+
+        Raises:
+            TypeViewError: By default, as recursive types are not supported.
+        """
+        raise TypeViewError(f"Recursive type {view!r} is not supported by {self.__class__.__name__}.")
+
+    def alias_value(self, view: TypeView[Any]) -> TypeView[Any]:
+        """The view of the value of a type alias, shared by all visits of the alias."""
+        alias_key = id(view.annotation)
+        value = self._alias_values.get(alias_key)
+        if value is None:
+            value = self._alias_values[alias_key] = view.strip_type_alias()
+        return value
+
+
+class TypeViewTransformer(TypeViewVisitor[TypeView[Any]]):
+    """Base class for rewrites of the tree of a :class:`TypeView`, bottom-up.
+
+    Subclasses implement :meth:`transform`, which receives each view after its children were transformed. Views are
+    only rebuilt where a child changed, so that an unchanged tree is returned as is. Type aliases whose value
+    changed are replaced by the transformed value, and recursive references to a type alias are left unchanged.
+
+    Examples:
+        >>> from typing import Dict, List
+        >>> from type_lens import TypeView
+        >>> from type_lens.visitor import TypeViewTransformer
+        >>> class IntToStr(TypeViewTransformer):
+        ...     def transform(self, view):
+        ...         return TypeView(str) if view.annotation is int else view
+        >>> IntToStr().visit(TypeView(Dict[str, List[int]]))
+        TypeView(Dict[str, List[str]])
+    """
+
+    __slots__ = ()
+
+    def visit_view(self, view: TypeView[Any], children: Iterator[TypeView[Any]]) -> TypeView[Any]:
+        if view.is_type_alias:
+            value = next(children)
+            return self.transform(view if value is self.alias_value(view) else value)
+        return self.transform(view.with_inner_types(tuple(children)))
+
+    def visit_cycle(self, view: TypeView[Any]) -> TypeView[Any]:
+        return view
+
+    def transform(self, view: TypeView[Any]) -> TypeView[Any]:
+        """Rewrite a view, whose children were already transformed.
+
+        Args:
+            view: The view to rewrite.
+
+        Returns:
+            The rewritten view, or ``view`` itself if it is unchanged.
+        """
+        return view